@@ -41,6 +41,7 @@ _mappings = {
     "convert_avro_schema_to_java": (f"{mod}.avrotojava", "convert_avro_schema_to_java"),
     "convert_avro_to_csharp": (f"{mod}.avrotocsharp", "convert_avro_to_csharp"),
     "convert_avro_schema_to_csharp": (f"{mod}.avrotocsharp", "convert_avro_schema_to_csharp"),
+    "convert_to_csharp": (f"{mod}.avrotocsharp", "convert_to_csharp"),
     "convert_avro_to_python": (f"{mod}.avrotopython", "convert_avro_to_python"),
     "convert_avro_schema_to_python": (f"{mod}.avrotopython", "convert_avro_schema_to_python"),
     "convert_avro_to_typescript": (f"{mod}.avrotots", "convert_avro_to_typescript"),
@@ -2,13 +2,15 @@
 
 """ AvroToCSharp class for converting Avro schema to C# classes """
 
+import functools
+import hashlib
 import json
 import os
 import re
-from typing import Any, Dict, List, Tuple, Union, cast
+from typing import Any, Dict, List, Set, Tuple, Union, cast
 import uuid
 
-from avrotize.common import build_flat_type_dict, inline_avro_references, is_generic_avro_type, pascal, process_template
+from avrotize.common import build_flat_type_dict, inline_avro_references, is_generic_avro_type, load_json_document, pascal, process_template
 from avrotize.constants import (
     CSHARP_AVRO_VERSION,
     NEWTONSOFT_JSON_VERSION,
@@ -22,13 +24,88 @@ from avrotize.constants import (
     MSTEST_SDK_VERSION,
     COVERLET_VERSION,
 )
-import glob
 
 JsonNode = Dict[str, 'JsonNode'] | List['JsonNode'] | str | None
 
+# pascal() is pure and is applied to the same namespace, type and field names on every emission pass
+pascal = functools.lru_cache(maxsize=4096)(pascal)
+
 
 INDENT = '    '
 
+# manifest of the files the last conversion of an in-memory schema wrote into an output directory, see skip_unchanged
+SCHEMA_CACHE_FILE = '.avrotize_cache.json'
+
+DICTIONARY_TYPE_PATTERN = re.compile(r"Dictionary<(.+)\s*,\s*(.+)>")
+LIST_TYPE_PATTERN = re.compile(r"List<(.+)>")
+
+CSHARP_RESERVED_WORDS = frozenset([
+    'abstract', 'as', 'base', 'bool', 'break', 'byte', 'case', 'catch', 'char', 'checked', 'class', 'const',
+    'continue', 'decimal', 'default', 'delegate', 'do', 'double', 'else', 'enum', 'event', 'explicit', 'extern',
+    'false', 'finally', 'fixed', 'float', 'for', 'foreach', 'goto', 'if', 'implicit', 'in', 'int', 'interface',
+    'internal', 'is', 'lock', 'long', 'namespace', 'new', 'null', 'object', 'operator', 'out', 'override',
+    'params', 'private', 'protected', 'public', 'readonly', 'ref', 'return', 'sbyte', 'sealed', 'short', 'sizeof',
+    'stackalloc', 'static', 'string', 'struct', 'switch', 'this', 'throw', 'true', 'try', 'typeof', 'uint', 'ulong',
+    'unchecked', 'unsafe', 'ushort', 'using', 'virtual', 'void', 'volatile', 'while'
+])
+
+CSHARP_PRIMITIVE_TYPES = frozenset(['null', 'bool', 'int', 'long', 'float', 'double', 'bytes', 'string', 'DateTime', 'decimal', 'short', 'sbyte', 'ushort', 'uint', 'ulong', 'byte[]', 'object'])
+
+AVRO_PRIMITIVE_TO_CSHARP = {
+    'null': 'void',  # Placeholder, actual handling for nullable types is in the union logic
+    'boolean': 'bool',
+    'int': 'int',
+    'long': 'long',
+    'float': 'float',
+    'double': 'double',
+    'bytes': 'byte[]',
+    'string': 'string',
+}
+
+# ISpecificRecord.Get/Put switch cases by the kind of the field's C# type
+AVRO_GET_CASE_DEFAULT = "case {pos}: return this.{name};"
+AVRO_GET_CASES = {
+    "union": "case {pos}: return this.{name}?.ToObject();",
+    "enum": "case {pos}: return ({type})this.{name};",
+}
+AVRO_PUT_CASE_DEFAULT = "case {pos}: this.{name} = ({type})fieldValue; break;"
+AVRO_PUT_CASES = {
+    "union": "case {pos}: this.{name} = {type}.FromObject(fieldValue); break;",
+    "enum": "case {pos}: this.{name} = fieldValue is global::Avro.Generic.GenericEnum?Enum.Parse<{type}>(((global::Avro.Generic.GenericEnum)fieldValue).Value):({type})fieldValue; break;",
+    "class": "case {pos}: this.{name} = fieldValue is global::Avro.Generic.GenericRecord?new {type}((global::Avro.Generic.GenericRecord)fieldValue):({type})fieldValue; break;",
+    "list_of_class": "case {pos}: this.{name} = fieldValue is Object[]?((Object[])fieldValue).Select(x => new {inner_type}((global::Avro.Generic.GenericRecord)x)).ToList():({type})fieldValue; break;",
+    "list": "case {pos}: this.{name} = fieldValue is Object[]?((Object[])fieldValue).Select(x => ({inner_type})x).ToList():({type})fieldValue; break;",
+}
+
+# ISpecificRecord Get/Put method scaffolding; the emitted cases go between head and tail, one per line
+AVRO_CASE_SEPARATOR = f"\n{INDENT*3}"
+AVRO_GET_METHOD_HEAD = f"\n{INDENT}object global::Avro.Specific.ISpecificRecord.Get(int fieldPos)\n{INDENT}{{\n{INDENT*2}switch (fieldPos)\n{INDENT*2}{{"
+AVRO_GET_METHOD_TAIL = f"\n{INDENT*3}default: throw new global::Avro.AvroRuntimeException($\"Bad index {{fieldPos}} in Get()\");\n{INDENT*2}}}\n{INDENT}}}"
+AVRO_PUT_METHOD_HEAD = f"\n{INDENT}void global::Avro.Specific.ISpecificRecord.Put(int fieldPos, object fieldValue)\n{INDENT}{{\n{INDENT*2}switch (fieldPos)\n{INDENT*2}{{"
+AVRO_PUT_METHOD_TAIL = f"\n{INDENT*3}default: throw new global::Avro.AvroRuntimeException($\"Bad index {{fieldPos}} in Put()\");\n{INDENT*2}}}\n{INDENT}}}\n"
+
+# System.Text.Json value kind tests for the C# types that map directly onto a JSON value kind
+JSON_VALUE_KIND_CHECKS = {
+    'byte[]': '{name}.ValueKind == System.Text.Json.JsonValueKind.String',
+    'string': '{name}.ValueKind == System.Text.Json.JsonValueKind.String',
+    **{numeric_type: '{name}.ValueKind == System.Text.Json.JsonValueKind.Number'
+       for numeric_type in ('int', 'long', 'float', 'double', 'decimal', 'short', 'sbyte', 'ushort', 'uint', 'ulong')},
+    'bool': '{name}.ValueKind == System.Text.Json.JsonValueKind.True || {name}.ValueKind == System.Text.Json.JsonValueKind.False',
+}
+
+CSHARP_PRIMITIVE_TO_CLR_TYPE = {
+    "int": "Int32",
+    "long": "Int64",
+    "float": "Single",
+    "double": "Double",
+    "decimal": "Decimal",
+    "short": "Int16",
+    "sbyte": "SByte",
+    "ushort": "UInt16",
+    "uint": "UInt32",
+    "ulong": "UInt64"
+}
+
 AVRO_CLASS_PREAMBLE = \
 """
 public {type_name}(global::Avro.Generic.GenericRecord obj)
@@ -41,25 +118,118 @@ public {type_name}(global::Avro.Generic.GenericRecord obj)
 }
 """
 
+
+@functools.lru_cache(maxsize=None)
+def csharp_using_directives(protobuf_net_annotation: bool, system_text_json_annotation: bool, newtonsoft_json_annotation: bool,
+                            system_xml_annotation: bool, msgpack_annotation: bool, cbor_annotation: bool) -> str:
+    """ Returns the using directives for a generated file with the given annotations enabled """
+    # Common using statements (add more as needed)
+    usings = ["using System;\nusing System.Collections.Generic;\n", "using System.Linq;\n"]
+    if protobuf_net_annotation:
+        usings.append("using ProtoBuf;\n")
+    if system_text_json_annotation:
+        usings.append("using System.Text.Json;\n")
+        usings.append("using System.Text.Json.Serialization;\n")
+    if newtonsoft_json_annotation:
+        usings.append("using Newtonsoft.Json;\n")
+    if system_xml_annotation:  # Add XML serialization using directive
+        usings.append("using System.Xml.Serialization;\n")
+    if msgpack_annotation:  # Add MessagePack serialization using directive
+        usings.append("using MessagePack;\n")
+    if cbor_annotation:  # Add CBOR serialization using directive
+        usings.append("using Dahomey.Cbor.Attributes;\n")
+    return "".join(usings)
+
+
+def has_file_with_extension(directory: str, extension: str) -> bool:
+    """ Checks whether a directory contains a (non-hidden) entry with the given extension """
+    try:
+        with os.scandir(directory) as entries:
+            return any(entry.name.endswith(extension) and not entry.name.startswith('.') for entry in entries)
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def generator_fingerprint() -> bytes:
+    """ Digests the avrotize version, this module and the C# templates, so that output of another generator is never reused """
+    try:
+        from avrotize._version import version
+    except ImportError:
+        version = 'dev'
+    digest = hashlib.blake2b(version.encode('utf-8'), digest_size=16)
+    template_dir = os.path.join(os.path.dirname(__file__), 'avrotocsharp')
+    for source_file in [__file__] + sorted(os.path.join(template_dir, name) for name in os.listdir(template_dir)):
+        with open(source_file, 'rb') as file:
+            digest.update(file.read())
+    return digest.digest()
+
+
+def schema_cache_key(avro_schema: JsonNode, base_namespace: str, project_name: str, flags: Tuple[bool, ...]) -> str | None:
+    """ Computes a digest of a schema, the options it is converted with and the generator that converts it,
+        or None if the schema has no canonical JSON form, e.g. because its dict keys are not all strings """
+    try:
+        canonical_schema = json.dumps(avro_schema, sort_keys=True, separators=(',', ':'), default=str).encode('utf-8')
+    except (TypeError, ValueError):
+        return None
+    options = f"\0{base_namespace}\0{project_name}\0{''.join('1' if flag else '0' for flag in flags)}".encode('utf-8')
+    return hashlib.blake2b(generator_fingerprint() + canonical_schema + options, digest_size=16).hexdigest()
+
+
+def file_digest(file_path: str) -> str | None:
+    """ Computes a digest of a file's content, or None if the file can't be read """
+    try:
+        with open(file_path, 'rb') as file:
+            return hashlib.blake2b(file.read(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+
+
+def is_cached_output_current(output_dir: str, cache_key: str) -> bool:
+    """ Checks whether output_dir holds the unmodified output of the conversion identified by cache_key """
+    try:
+        with open(os.path.join(output_dir, SCHEMA_CACHE_FILE), 'r', encoding='utf-8') as file:
+            manifest = json.load(file)
+    except (OSError, ValueError):
+        return False
+    if not isinstance(manifest, dict) or manifest.get('key') != cache_key or not isinstance(manifest.get('files'), dict):
+        return False
+    return all(file_digest(os.path.join(output_dir, file_name)) == digest for file_name, digest in manifest['files'].items())
+
+
+def write_schema_cache(output_dir: str, cache_key: str, written_files: List[str]) -> None:
+    """ Records cache_key and the content digests of the files the conversion wrote into output_dir """
+    files = {os.path.relpath(file_path, output_dir): file_digest(file_path) for file_path in written_files}
+    with open(os.path.join(output_dir, SCHEMA_CACHE_FILE), 'w', encoding='utf-8') as file:
+        json.dump({'key': cache_key, 'files': dict(sorted(files.items()))}, file, indent=1)
+
+
 class AvroToCSharp:
     """ Converts Avro schema to C# classes """
 
-    def __init__(self, base_namespace: str = '') -> None:
+    def __init__(self, base_namespace: str = '', *, project_name: str = '', pascal_properties: bool = False,
+                 system_text_json_annotation: bool = False, newtonsoft_json_annotation: bool = False,
+                 system_xml_annotation: bool = False, msgpack_annotation: bool = False, cbor_annotation: bool = False,
+                 avro_annotation: bool = False, protobuf_net_annotation: bool = False) -> None:
         self.base_namespace = base_namespace
-        self.project_name: str = ''  # Optional explicit project name, separate from namespace
+        self.project_name: str = project_name  # Optional explicit project name, separate from namespace
         self.schema_doc: JsonNode = None
         self.output_dir = os.getcwd()
-        self.pascal_properties = False
-        self.system_text_json_annotation = False
-        self.newtonsoft_json_annotation = False
-        self.system_xml_annotation = False
-        self.msgpack_annotation = False
-        self.cbor_annotation = False
-        self.avro_annotation = False
-        self.protobuf_net_annotation = False
+        self.pascal_properties = pascal_properties
+        self.system_text_json_annotation = system_text_json_annotation
+        self.newtonsoft_json_annotation = newtonsoft_json_annotation
+        self.system_xml_annotation = system_xml_annotation
+        self.msgpack_annotation = msgpack_annotation
+        self.cbor_annotation = cbor_annotation
+        self.avro_annotation = avro_annotation
+        self.protobuf_net_annotation = protobuf_net_annotation
         self.generated_types: Dict[str,str] = {}
         self.generated_avro_types: Dict[str, Dict[str, Union[str, Dict, List]]] = {}
         self.type_dict: Dict[str, Dict] = {}
+        self.type_cache: Dict[Tuple[int, str, str, str], Tuple[JsonNode, int, str]] = {}
+        self.known_directories: Set[str] = set()
+        self.enum_type_cache: Dict[str, bool] = {}
+        self.written_files: List[str] = []
 
     def get_qualified_name(self, namespace: str, name: str) -> str:
         """ Concatenates namespace and name with a dot separator """
@@ -76,59 +246,55 @@ class AvroToCSharp:
 
     def map_primitive_to_csharp(self, avro_type: str) -> str:
         """ Maps Avro primitive types to C# types """
-        mapping = {
-            'null': 'void',  # Placeholder, actual handling for nullable types is in the union logic
-            'boolean': 'bool',
-            'int': 'int',
-            'long': 'long',
-            'float': 'float',
-            'double': 'double',
-            'bytes': 'byte[]',
-            'string': 'string',
-        }
         qualified_class_name = 'global::'+self.get_qualified_name(pascal(self.base_namespace), pascal(avro_type))
         if qualified_class_name in self.generated_avro_types:
             result = qualified_class_name
         else:
-            result = mapping.get(avro_type, 'object')
+            result = AVRO_PRIMITIVE_TO_CSHARP.get(avro_type, 'object')
         return result
 
     def is_csharp_reserved_word(self, word: str) -> bool:
         """ Checks if a word is a reserved C# keyword """
-        reserved_words = [
-            'abstract', 'as', 'base', 'bool', 'break', 'byte', 'case', 'catch', 'char', 'checked', 'class', 'const',
-            'continue', 'decimal', 'default', 'delegate', 'do', 'double', 'else', 'enum', 'event', 'explicit', 'extern',
-            'false', 'finally', 'fixed', 'float', 'for', 'foreach', 'goto', 'if', 'implicit', 'in', 'int', 'interface',
-            'internal', 'is', 'lock', 'long', 'namespace', 'new', 'null', 'object', 'operator', 'out', 'override',
-            'params', 'private', 'protected', 'public', 'readonly', 'ref', 'return', 'sbyte', 'sealed', 'short', 'sizeof',
-            'stackalloc', 'static', 'string', 'struct', 'switch', 'this', 'throw', 'true', 'try', 'typeof', 'uint', 'ulong',
-            'unchecked', 'unsafe', 'ushort', 'using', 'virtual', 'void', 'volatile', 'while'
-        ]
-        return word in reserved_words
+        return word in CSHARP_RESERVED_WORDS
+
+    def resolve_field_name(self, field: Dict, class_name: str) -> str:
+        """ Resolves the C# property name of a field """
+        field_name = field['name']
+        if field_name in CSHARP_RESERVED_WORDS:
+            field_name = f"@{field_name}"
+        if self.pascal_properties:
+            field_name = pascal(field_name)
+        if field_name == class_name:
+            field_name += "_"
+        return field_name
 
     def is_csharp_primitive_type(self, csharp_type: str) -> bool:
         """ Checks if an Avro type is a C# primitive type """
         if csharp_type.endswith('?'):
             csharp_type = csharp_type[:-1]
-        return csharp_type in ['null', 'bool', 'int', 'long', 'float', 'double', 'bytes', 'string', 'DateTime', 'decimal', 'short', 'sbyte', 'ushort', 'uint', 'ulong', 'byte[]', 'object']
+        return csharp_type in CSHARP_PRIMITIVE_TYPES
 
     def map_csharp_primitive_to_clr_type(self, cs_type: str) -> str:
         """ Maps C# primitive types to CLR types"""
-        map = {
-            "int": "Int32",
-            "long": "Int64",
-            "float": "Single",
-            "double": "Double",
-            "decimal": "Decimal",
-            "short": "Int16",
-            "sbyte": "SByte",
-            "ushort": "UInt16",
-            "uint": "UInt32",
-            "ulong": "UInt64"
-        }
-        return map.get(cs_type, cs_type)
+        return CSHARP_PRIMITIVE_TO_CLR_TYPE.get(cs_type, cs_type)
 
     def convert_avro_type_to_csharp(self, class_name: str, field_name: str, avro_type: JsonNode, parent_namespace: str) -> str:
+        """ Converts Avro type to C# type, memoizing the result for complex type nodes """
+        if not isinstance(avro_type, (dict, list)):
+            return self.resolve_avro_type_to_csharp(class_name, field_name, avro_type, parent_namespace)
+        # named type references resolve against the generated types, so a cached result
+        # is only reused while no further types have been registered
+        key = (id(avro_type), class_name, field_name, parent_namespace)
+        generation = len(self.generated_types)
+        cached = self.type_cache.get(key)
+        if cached is not None and cached[0] is avro_type and cached[1] == generation:
+            return cached[2]
+        result = self.resolve_avro_type_to_csharp(class_name, field_name, avro_type, parent_namespace)
+        if len(self.generated_types) == generation:
+            self.type_cache[key] = (avro_type, generation, result)
+        return result
+
+    def resolve_avro_type_to_csharp(self, class_name: str, field_name: str, avro_type: JsonNode, parent_namespace: str) -> str:
         """ Converts Avro type to C# type """
         if isinstance(avro_type, str):
             return self.map_primitive_to_csharp(avro_type)
@@ -164,7 +330,6 @@ class AvroToCSharp:
 
     def generate_class(self, avro_schema: Dict, parent_namespace: str, write_file: bool) -> str:
         """ Generates a Class """
-        class_definition = ''
         avro_namespace = avro_schema.get('namespace', parent_namespace)
         if not 'namespace' in avro_schema:
             avro_schema['namespace'] = parent_namespace
@@ -174,93 +339,80 @@ class AvroToCSharp:
         ref = 'global::'+self.get_qualified_name(namespace, class_name)
         if ref in self.generated_types:
             return ref
+        # reserve the name before walking the fields so that re-entrant visits return the reference
+        self.generated_types[ref] = "class"
 
-        class_definition += f"/// <summary>\n/// { avro_schema.get('doc', class_name ) }\n/// </summary>\n"
+        i2, i3 = INDENT*2, INDENT*3
+        parts: List[str] = [f"/// <summary>\n/// { avro_schema.get('doc', class_name ) }\n/// </summary>\n"]
 
         # Add XML serialization attribute for the class if enabled
         if self.system_xml_annotation:
             if xml_namespace:
-                class_definition += f"[XmlRoot(\"{class_name}\", Namespace=\"{xml_namespace}\")]\n"
+                parts.append(f"[XmlRoot(\"{class_name}\", Namespace=\"{xml_namespace}\")]\n")
             else:
-                class_definition += f"[XmlRoot(\"{class_name}\")]\n"
+                parts.append(f"[XmlRoot(\"{class_name}\")]\n")
 
         if self.protobuf_net_annotation:
-            class_definition += "[ProtoContract]\n"
+            parts.append("[ProtoContract]\n")
 
         # Add MessagePack serialization attribute for the class if enabled
         if self.msgpack_annotation:
-            class_definition += "[MessagePackObject]\n"
+            parts.append("[MessagePackObject]\n")
 
-        fields_str = [self.generate_property(index + 1, field, class_name, avro_namespace) for index, field in enumerate(avro_schema.get('fields', []))]
+        fields = avro_schema.get('fields', [])
+        # resolve each field's C# type once and reuse it for all emission passes below
+        convert_type, resolve_field_name, generate_property = self.convert_avro_type_to_csharp, self.resolve_field_name, self.generate_property
+        field_types = [convert_type(class_name, field['name'], field['type'], avro_namespace) for field in fields]
+        field_names = [resolve_field_name(field, class_name) for field in fields]
+        fields_str = [generate_property(index + 1, field, class_name, avro_namespace, field_type=field_types[index], field_name=field_names[index]) for index, field in enumerate(fields)]
         class_body = "\n".join(fields_str)
-        class_definition += f"public partial class {class_name}"
+        parts.append(f"public partial class {class_name}")
         if self.avro_annotation:
-            class_definition += " : global::Avro.Specific.ISpecificRecord"
-        class_definition += "\n{\n"+class_body
-        class_definition += f"\n{INDENT}/// <summary>\n{INDENT}/// Default constructor\n{INDENT}///</summary>\n"
-        class_definition += f"{INDENT}public {class_name}()\n{INDENT}{{\n{INDENT}}}"
+            parts.append(" : global::Avro.Specific.ISpecificRecord")
+        parts.append("\n{\n"+class_body)
+        parts.append(f"\n{INDENT}/// <summary>\n{INDENT}/// Default constructor\n{INDENT}///</summary>\n")
+        parts.append(f"{INDENT}public {class_name}()\n{INDENT}{{\n{INDENT}}}")
         if self.avro_annotation:
-            class_definition += f"\n\n{INDENT}/// <summary>\n{INDENT}/// Constructor from Avro GenericRecord\n{INDENT}///</summary>\n"
-            class_definition += f"{INDENT}public {class_name}(global::Avro.Generic.GenericRecord obj)\n{INDENT}{{\n"
-            class_definition += f"{INDENT*2}global::Avro.Specific.ISpecificRecord self = this;\n"
-            class_definition += f"{INDENT*2}for (int i = 0; obj.Schema.Fields.Count > i; ++i)\n{INDENT*2}{{\n"
-            class_definition += f"{INDENT*3}self.Put(i, obj.GetValue(i));\n{INDENT*2}}}\n{INDENT}}}\n"
+            parts.append(f"\n\n{INDENT}/// <summary>\n{INDENT}/// Constructor from Avro GenericRecord\n{INDENT}///</summary>\n")
+            parts.append(f"{INDENT}public {class_name}(global::Avro.Generic.GenericRecord obj)\n{INDENT}{{\n")
+            parts.append(f"{i2}global::Avro.Specific.ISpecificRecord self = this;\n")
+            parts.append(f"{i2}for (int i = 0; obj.Schema.Fields.Count > i; ++i)\n{i2}{{\n")
+            parts.append(f"{i3}self.Put(i, obj.GetValue(i));\n{i2}}}\n{INDENT}}}\n")
         if self.avro_annotation:
             
             local_avro_schema = inline_avro_references(avro_schema.copy(), self.type_dict, '')
             avro_schema_json = json.dumps(local_avro_schema)
-            # wrap schema at 80 characters
-            avro_schema_json = avro_schema_json.replace('"', '§')
+            # wrap schema at 80 characters; quotes are escaped per chunk so that an escape is never split across chunks
             avro_schema_json = f"\"+\n{INDENT}\"".join(
-                [avro_schema_json[i:i+80] for i in range(0, len(avro_schema_json), 80)])
-            avro_schema_json = avro_schema_json.replace('§', '\\"')
-            class_definition += f"\n\n{INDENT}/// <summary>\n{INDENT}/// Avro schema for this class\n{INDENT}/// </summary>"
-            class_definition += f"\n{INDENT}public static global::Avro.Schema AvroSchema = global::Avro.Schema.Parse(\n{INDENT}\"{avro_schema_json}\");\n"
-            class_definition += f"\n{INDENT}global::Avro.Schema global::Avro.Specific.ISpecificRecord.Schema => AvroSchema;\n"
-            get_method = f"{INDENT}object global::Avro.Specific.ISpecificRecord.Get(int fieldPos)\n" + \
-                INDENT+"{"+f"\n{INDENT*2}switch (fieldPos)\n{INDENT*2}" + "{"
-            put_method = f"{INDENT}void global::Avro.Specific.ISpecificRecord.Put(int fieldPos, object fieldValue)\n" + \
-                INDENT+"{"+f"\n{INDENT*2}switch (fieldPos)\n{INDENT*2}"+"{"
-            for pos, field in enumerate(avro_schema.get('fields', [])):
-                field_name = field['name']
-                if self.is_csharp_reserved_word(field_name):
-                    field_name = f"@{field_name}"
-                field_type = self.convert_avro_type_to_csharp(class_name, field_name, field['type'], avro_namespace)
-                if self.pascal_properties:
-                    field_name = pascal(field_name)
-                if field_name == class_name:
-                    field_name += "_"
-                if field_type in self.generated_types:
-                    if self.generated_types[field_type] == "union":
-                        get_method += f"\n{INDENT*3}case {pos}: return this.{field_name}?.ToObject();"
-                        put_method += f"\n{INDENT*3}case {pos}: this.{field_name} = {field_type}.FromObject(fieldValue); break;"
-                    elif self.generated_types[field_type] == "enum":
-                        get_method += f"\n{INDENT*3}case {pos}: return ({field_type})this.{field_name};"
-                        put_method += f"\n{INDENT*3}case {pos}: this.{field_name} = fieldValue is global::Avro.Generic.GenericEnum?Enum.Parse<{field_type}>(((global::Avro.Generic.GenericEnum)fieldValue).Value):({field_type})fieldValue; break;"
-                    elif self.generated_types[field_type] == "class":
-                        get_method += f"\n{INDENT*3}case {pos}: return this.{field_name};"
-                        put_method += f"\n{INDENT*3}case {pos}: this.{field_name} = fieldValue is global::Avro.Generic.GenericRecord?new {field_type}((global::Avro.Generic.GenericRecord)fieldValue):({field_type})fieldValue; break;"
-                else:
-                    get_method += f"\n{INDENT*3}case {pos}: return this.{field_name};"
-                    if field_type.startswith("List<"):
-                        inner_type = field_type.strip()[5:-2] if field_type[-1] == '?' else field_type[5:-1]
-                        if inner_type in self.generated_types:
-                            if self.generated_types[inner_type] == "class":
-                                put_method += f"\n{INDENT*3}case {pos}: this.{field_name} = fieldValue is Object[]?((Object[])fieldValue).Select(x => new {inner_type}((global::Avro.Generic.GenericRecord)x)).ToList():({field_type})fieldValue; break;"
-                            else:
-                                put_method += f"\n{INDENT*3}case {pos}: this.{field_name} = fieldValue is Object[]?((Object[])fieldValue).Select(x => ({inner_type})x).ToList():({field_type})fieldValue; break;"
-                        else:
-                            put_method += f"\n{INDENT*3}case {pos}: this.{field_name} = fieldValue is Object[]?((Object[])fieldValue).Select(x => ({inner_type})x).ToList():({field_type})fieldValue; break;"
-                    else:
-                        put_method += f"\n{INDENT*3}case {pos}: this.{field_name} = ({field_type})fieldValue; break;"
-            get_method += f"\n{INDENT*3}default: throw new global::Avro.AvroRuntimeException($\"Bad index {{fieldPos}} in Get()\");"
-            put_method += f"\n{INDENT*3}default: throw new global::Avro.AvroRuntimeException($\"Bad index {{fieldPos}} in Put()\");"
-            get_method += "\n"+INDENT+INDENT+"}\n"+INDENT+"}"
-            put_method += "\n"+INDENT+INDENT+"}\n"+INDENT+"}"
-            class_definition += f"\n{get_method}\n{put_method}\n"
+                avro_schema_json[i:i+80].replace('"', '\\"') for i in range(0, len(avro_schema_json), 80))
+            parts.append(f"\n\n{INDENT}/// <summary>\n{INDENT}/// Avro schema for this class\n{INDENT}/// </summary>")
+            parts.append(f"\n{INDENT}public static global::Avro.Schema AvroSchema = global::Avro.Schema.Parse(\n{INDENT}\"{avro_schema_json}\");\n")
+            parts.append(f"\n{INDENT}global::Avro.Schema global::Avro.Specific.ISpecificRecord.Schema => AvroSchema;\n")
+            get_cases: List[str] = []
+            put_cases: List[str] = []
+            type_kind_of, get_case_template = self.generated_types.get, AVRO_GET_CASES.get
+            for pos, field_name in enumerate(field_names):
+                field_type = field_types[pos]
+                inner_type = ''
+                type_kind = type_kind_of(field_type)
+                if type_kind is None and field_type.startswith("List<"):
+                    inner_type = field_type.strip()[5:-2] if field_type[-1] == '?' else field_type[5:-1]
+                    type_kind = "list_of_class" if type_kind_of(inner_type) == "class" else "list"
+                if type_kind in AVRO_PUT_CASES:
+                    get_cases.append(get_case_template(type_kind, AVRO_GET_CASE_DEFAULT).format(pos=pos, name=field_name, type=field_type))
+                    put_cases.append(AVRO_PUT_CASES[type_kind].format(pos=pos, name=field_name, type=field_type, inner_type=inner_type))
+                elif type_kind is None:
+                    get_cases.append(AVRO_GET_CASE_DEFAULT.format(pos=pos, name=field_name))
+                    put_cases.append(AVRO_PUT_CASE_DEFAULT.format(pos=pos, name=field_name, type=field_type))
+            parts.append(AVRO_GET_METHOD_HEAD)
+            parts.extend(AVRO_CASE_SEPARATOR + case for case in get_cases)
+            parts.append(AVRO_GET_METHOD_TAIL)
+            parts.append(AVRO_PUT_METHOD_HEAD)
+            parts.extend(AVRO_CASE_SEPARATOR + case for case in put_cases)
+            parts.append(AVRO_PUT_METHOD_TAIL)
 
         # emit helper methods
-        class_definition += process_template(
+        parts.append(process_template(
             "avrotocsharp/dataclass_core.jinja",
             class_name=class_name,
             avro_annotation=self.avro_annotation,
@@ -270,136 +422,108 @@ class AvroToCSharp:
             system_xml_annotation=self.system_xml_annotation,
             msgpack_annotation=self.msgpack_annotation,
             cbor_annotation=self.cbor_annotation,
-            json_match_clauses=self.create_is_json_match_clauses(avro_schema, avro_namespace, class_name)
-        )
+            json_match_clauses=self.create_is_json_match_clauses(avro_schema, avro_namespace, class_name, field_types)
+        ))
 
         # emit Equals and GetHashCode for value equality
-        class_definition += self.generate_equals_and_gethashcode(avro_schema, class_name, avro_namespace)
+        parts.append(self.generate_equals_and_gethashcode(avro_schema, class_name, avro_namespace, field_types, field_names))
 
-        class_definition += "\n"+"}"
+        parts.append("\n}")
+        class_definition = "".join(parts)
 
         if write_file:
             self.write_to_file(namespace, class_name, class_definition)
 
-        self.generated_types[ref] = "class"
         self.generated_avro_types[ref] = avro_schema
         return ref
 
-    def create_is_json_match_clauses(self, avro_schema, parent_namespace, class_name) -> List[str]:
+    def create_is_json_match_clauses(self, avro_schema, parent_namespace, class_name, field_types: List[str] | None = None) -> List[str]:
         """ Generates the IsJsonMatch method for System.Text.Json """
         clauses: List[str] = []
-        for field in avro_schema.get('fields', []):
+        is_json_match_clause = self.get_is_json_match_clause
+        for index, field in enumerate(avro_schema.get('fields', [])):
             field_name = field['name']
-            if self.is_csharp_reserved_word(field_name):
+            if field_name in CSHARP_RESERVED_WORDS:
                 field_name = f"@{field_name}"
             if field_name == class_name:
                 field_name += "_"
-            field_type = self.convert_avro_type_to_csharp(
+            field_type = field_types[index] if field_types is not None else self.convert_avro_type_to_csharp(
                     class_name, field_name, field['type'], parent_namespace)
-            clauses.append(self.get_is_json_match_clause(class_name, field_name, field_type))
+            clauses.append(is_json_match_clause(class_name, field_name, field_type))
         if len(clauses) == 0:
             clauses.append("true")
         return clauses
 
     def get_is_json_match_clause(self, class_name, field_name, field_type) -> str:
         """ Generates the IsJsonMatch clause for a field """
-        class_definition = ''
         field_name_js = field_name[1:] if field_name[0] == '@' else field_name
         is_optional = field_type[-1] == '?'
         field_type = field_type[:-1] if is_optional else field_type
-        if field_type == 'byte[]':
-            class_definition += f"({'!' if is_optional else ''}element.TryGetProperty(\"{field_name_js}\", out System.Text.Json.JsonElement {field_name}) {'||' if is_optional else '&&'} ({field_name}.ValueKind == System.Text.Json.JsonValueKind.String){f' || {field_name}.ValueKind == System.Text.Json.JsonValueKind.Null' if is_optional else ''})"
-        elif field_type == 'string':
-            class_definition += f"({'!' if is_optional else ''}element.TryGetProperty(\"{field_name_js}\", out System.Text.Json.JsonElement {field_name}) {'||' if is_optional else '&&'} ({field_name}.ValueKind == System.Text.Json.JsonValueKind.String){f' || {field_name}.ValueKind == System.Text.Json.JsonValueKind.Null' if is_optional else ''})"
-        elif field_type in ['int', 'long', 'float', 'double', 'decimal', 'short', 'sbyte', 'ushort', 'uint', 'ulong']:
-            class_definition += f"({'!' if is_optional else ''}element.TryGetProperty(\"{field_name_js}\", out System.Text.Json.JsonElement {field_name}) {'||' if is_optional else '&&'} ({field_name}.ValueKind == System.Text.Json.JsonValueKind.Number){f' || {field_name}.ValueKind == System.Text.Json.JsonValueKind.Null' if is_optional else ''})"
-        elif field_type == 'bool':
-            class_definition += f"({'!' if is_optional else ''}element.TryGetProperty(\"{field_name_js}\", out System.Text.Json.JsonElement {field_name}) {'||' if is_optional else '&&'} ({field_name}.ValueKind == System.Text.Json.JsonValueKind.True || {field_name}.ValueKind == System.Text.Json.JsonValueKind.False){f' || {field_name}.ValueKind == System.Text.Json.JsonValueKind.Null' if is_optional else ''})"
-        elif field_type.startswith("global::"):
+        probe = f"({'!' if is_optional else ''}element.TryGetProperty(\"{field_name_js}\", out System.Text.Json.JsonElement {field_name}) {'||' if is_optional else '&&'} "
+        value_kind_check = JSON_VALUE_KIND_CHECKS.get(field_type)
+        if value_kind_check is not None:
+            return f"{probe}({value_kind_check.format(name=field_name)}){f' || {field_name}.ValueKind == System.Text.Json.JsonValueKind.Null' if is_optional else ''})"
+        if field_type.startswith("global::"):
             type_kind = self.generated_types[field_type] if field_type in self.generated_types else "class"
             if type_kind == "class":
-                class_definition += f"({'!' if is_optional else ''}element.TryGetProperty(\"{field_name_js}\", out System.Text.Json.JsonElement {field_name}) {'||' if is_optional else '&&'} ({f'{field_name}.ValueKind == System.Text.Json.JsonValueKind.Null || ' if is_optional else ''}{field_type}.IsJsonMatch({field_name})))"
+                return f"{probe}({f'{field_name}.ValueKind == System.Text.Json.JsonValueKind.Null || ' if is_optional else ''}{field_type}.IsJsonMatch({field_name})))"
             elif type_kind == "enum":
-                class_definition += f"({'!' if is_optional else ''}element.TryGetProperty(\"{field_name_js}\", out System.Text.Json.JsonElement {field_name}) {'||' if is_optional else '&&'} ({f'{field_name}.ValueKind == System.Text.Json.JsonValueKind.Null ||' if is_optional else ''}({field_name}.ValueKind == System.Text.Json.JsonValueKind.String && Enum.TryParse<{field_type}>({field_name}.GetString(), true, out _ ))))"
-        else:
-            is_union = False
-            field_union = pascal(field_name)+'Union'
-            if field_type == field_union:
-                field_union = class_name+"."+pascal(field_name)+'Union'
-                type_kind = self.generated_types[field_union] if field_union in self.generated_types else "class"
-                if type_kind == "union":
-                    is_union = True
-                    class_definition += f"({'!' if is_optional else ''}element.TryGetProperty(\"{field_name_js}\", out System.Text.Json.JsonElement {field_name}) {'||' if is_optional else '&&'} ({f'{field_name}.ValueKind == System.Text.Json.JsonValueKind.Null || ' if is_optional else ''}{field_type}.IsJsonMatch({field_name})))"
-            if not is_union:
-                class_definition += f"({'!' if is_optional else ''}element.TryGetProperty(\"{field_name_js}\", out System.Text.Json.JsonElement {field_name}) {'||' if is_optional else '&&'} true )"
-        return class_definition
+                return f"{probe}({f'{field_name}.ValueKind == System.Text.Json.JsonValueKind.Null ||' if is_optional else ''}({field_name}.ValueKind == System.Text.Json.JsonValueKind.String && Enum.TryParse<{field_type}>({field_name}.GetString(), true, out _ ))))"
+            return ''
+        if field_type == pascal(field_name)+'Union':
+            field_union = class_name+"."+pascal(field_name)+'Union'
+            if self.generated_types.get(field_union, "class") == "union":
+                return f"{probe}({f'{field_name}.ValueKind == System.Text.Json.JsonValueKind.Null || ' if is_optional else ''}{field_type}.IsJsonMatch({field_name})))"
+        return f"{probe}true )"
 
     def get_is_json_match_clause_type(self, element_name, class_name, field_type) -> str:
         """ Generates the IsJsonMatch clause for a field """
-        class_definition = ''
         is_optional = field_type[-1] == '?'
         field_type = field_type[:-1] if is_optional else field_type
-        if field_type == 'byte[]':
-            class_definition += f"({element_name}.ValueKind == System.Text.Json.JsonValueKind.String{f' || {element_name}.ValueKind == System.Text.Json.JsonValueKind.Null' if is_optional else ''})"
-        elif field_type == 'string':
-            class_definition += f"({element_name}.ValueKind == System.Text.Json.JsonValueKind.String{f' || {element_name}.ValueKind == System.Text.Json.JsonValueKind.Null' if is_optional else ''})"
-        elif field_type in ['int', 'long', 'float', 'double', 'decimal', 'short', 'sbyte', 'ushort', 'uint', 'ulong']:
-            class_definition += f"({element_name}.ValueKind == System.Text.Json.JsonValueKind.Number{f' || {element_name}.ValueKind == System.Text.Json.JsonValueKind.Null' if is_optional else ''})"
-        elif field_type == 'bool':
-            class_definition += f"({element_name}.ValueKind == System.Text.Json.JsonValueKind.True || {element_name}.ValueKind == System.Text.Json.JsonValueKind.False{f' || {element_name}.ValueKind == System.Text.Json.JsonValueKind.Null' if is_optional else ''})"
-        elif field_type.startswith("global::"):
+        value_kind_check = JSON_VALUE_KIND_CHECKS.get(field_type)
+        if value_kind_check is not None:
+            return f"({value_kind_check.format(name=element_name)}{f' || {element_name}.ValueKind == System.Text.Json.JsonValueKind.Null' if is_optional else ''})"
+        if field_type.startswith("global::"):
             type_kind = self.generated_types[field_type] if field_type in self.generated_types else "class"
             if type_kind == "class":
-                class_definition += f"({f'{element_name}.ValueKind == System.Text.Json.JsonValueKind.Null || ' if is_optional else ''}{field_type}.IsJsonMatch({element_name}))"
+                return f"({f'{element_name}.ValueKind == System.Text.Json.JsonValueKind.Null || ' if is_optional else ''}{field_type}.IsJsonMatch({element_name}))"
             elif type_kind == "enum":
-                class_definition += f"({f'{element_name}.ValueKind == System.Text.Json.JsonValueKind.Null ||' if is_optional else ''}({element_name}.ValueKind == System.Text.Json.JsonValueKind.String && Enum.TryParse<{field_type}>({element_name}.GetString(), true, out _ )))"
-        else:
-            is_union = False
-            field_union = pascal(element_name)+'Union'
-            if field_type == field_union:
-                field_union = class_name+"."+pascal(element_name)+'Union'
-                type_kind = self.generated_types[field_union] if field_union in self.generated_types else "class"
-                if type_kind == "union":
-                    is_union = True
-                    class_definition += f"({f'{element_name}.ValueKind == System.Text.Json.JsonValueKind.Null || ' if is_optional else ''}{field_type}.IsJsonMatch({element_name})))"
-            if not is_union:
-                class_definition += f"({element_name}.ValueKind == System.Text.Json.JsonValueKind.Object{f' || {element_name}.ValueKind == System.Text.Json.JsonValueKind.Null' if is_optional else ''})"
-        return class_definition
-
-    def generate_equals_and_gethashcode(self, avro_schema: Dict, class_name: str, parent_namespace: str) -> str:
+                return f"({f'{element_name}.ValueKind == System.Text.Json.JsonValueKind.Null ||' if is_optional else ''}({element_name}.ValueKind == System.Text.Json.JsonValueKind.String && Enum.TryParse<{field_type}>({element_name}.GetString(), true, out _ )))"
+            return ''
+        if field_type == pascal(element_name)+'Union':
+            field_union = class_name+"."+pascal(element_name)+'Union'
+            if self.generated_types.get(field_union, "class") == "union":
+                return f"({f'{element_name}.ValueKind == System.Text.Json.JsonValueKind.Null || ' if is_optional else ''}{field_type}.IsJsonMatch({element_name})))"
+        return f"({element_name}.ValueKind == System.Text.Json.JsonValueKind.Object{f' || {element_name}.ValueKind == System.Text.Json.JsonValueKind.Null' if is_optional else ''})"
+
+    def generate_equals_and_gethashcode(self, avro_schema: Dict, class_name: str, parent_namespace: str, field_types: List[str] | None = None, field_names: List[str] | None = None) -> str:
         """ Generates Equals and GetHashCode methods for value equality """
-        code = "\n"
+        code: List[str] = ["\n"]
         fields = avro_schema.get('fields', [])
         
         if not fields:
             # Empty class - simple implementation
-            code += f"{INDENT}/// <summary>\n{INDENT}/// Determines whether the specified object is equal to the current object.\n{INDENT}/// </summary>\n"
-            code += f"{INDENT}public override bool Equals(object? obj)\n{INDENT}{{\n"
-            code += f"{INDENT*2}return obj is {class_name};\n"
-            code += f"{INDENT}}}\n\n"
-            code += f"{INDENT}/// <summary>\n{INDENT}/// Serves as the default hash function.\n{INDENT}/// </summary>\n"
-            code += f"{INDENT}public override int GetHashCode()\n{INDENT}{{\n"
-            code += f"{INDENT*2}return 0;\n"
-            code += f"{INDENT}}}\n"
-            return code
+            code.append(f"{INDENT}/// <summary>\n{INDENT}/// Determines whether the specified object is equal to the current object.\n{INDENT}/// </summary>\n")
+            code.append(f"{INDENT}public override bool Equals(object? obj)\n{INDENT}{{\n")
+            code.append(f"{INDENT*2}return obj is {class_name};\n")
+            code.append(f"{INDENT}}}\n\n")
+            code.append(f"{INDENT}/// <summary>\n{INDENT}/// Serves as the default hash function.\n{INDENT}/// </summary>\n")
+            code.append(f"{INDENT}public override int GetHashCode()\n{INDENT}{{\n")
+            code.append(f"{INDENT*2}return 0;\n")
+            code.append(f"{INDENT}}}\n")
+            return "".join(code)
         
         # Generate Equals method
-        code += f"{INDENT}/// <summary>\n{INDENT}/// Determines whether the specified object is equal to the current object.\n{INDENT}/// </summary>\n"
-        code += f"{INDENT}public override bool Equals(object? obj)\n{INDENT}{{\n"
-        code += f"{INDENT*2}if (obj is not {class_name} other) return false;\n"
+        code.append(f"{INDENT}/// <summary>\n{INDENT}/// Determines whether the specified object is equal to the current object.\n{INDENT}/// </summary>\n")
+        code.append(f"{INDENT}public override bool Equals(object? obj)\n{INDENT}{{\n")
+        code.append(f"{INDENT*2}if (obj is not {class_name} other) return false;\n")
         
         # Build equality comparisons for each field
         equality_checks = []
-        for field in fields:
-            field_name = field['name']
-            if self.is_csharp_reserved_word(field_name):
-                field_name = f"@{field_name}"
-            if self.pascal_properties:
-                field_name = pascal(field_name)
-            if field_name == class_name:
-                field_name += "_"
+        for index, field in enumerate(fields):
+            field_name = field_names[index] if field_names is not None else self.resolve_field_name(field, class_name)
             
-            field_type = self.convert_avro_type_to_csharp(class_name, field_name, field['type'], parent_namespace)
+            field_type = field_types[index] if field_types is not None else self.convert_avro_type_to_csharp(class_name, field_name, field['type'], parent_namespace)
             
             # Handle different types of comparisons
             if field_type == 'byte[]' or field_type == 'byte[]?':
@@ -420,28 +544,22 @@ class AvroToCSharp:
         
         # Join all checks with &&
         if len(equality_checks) == 1:
-            code += f"{INDENT*2}return {equality_checks[0]};\n"
+            code.append(f"{INDENT*2}return {equality_checks[0]};\n")
         else:
-            code += f"{INDENT*2}return " + f"\n{INDENT*3}&& ".join(equality_checks) + ";\n"
+            code.append(f"{INDENT*2}return " + f"\n{INDENT*3}&& ".join(equality_checks) + ";\n")
         
-        code += f"{INDENT}}}\n\n"
+        code.append(f"{INDENT}}}\n\n")
         
         # Generate GetHashCode method
-        code += f"{INDENT}/// <summary>\n{INDENT}/// Serves as the default hash function.\n{INDENT}/// </summary>\n"
-        code += f"{INDENT}public override int GetHashCode()\n{INDENT}{{\n"
+        code.append(f"{INDENT}/// <summary>\n{INDENT}/// Serves as the default hash function.\n{INDENT}/// </summary>\n")
+        code.append(f"{INDENT}public override int GetHashCode()\n{INDENT}{{\n")
         
         # Collect field names for HashCode.Combine
         hash_fields = []
-        for field in fields:
-            field_name = field['name']
-            if self.is_csharp_reserved_word(field_name):
-                field_name = f"@{field_name}"
-            if self.pascal_properties:
-                field_name = pascal(field_name)
-            if field_name == class_name:
-                field_name += "_"
+        for index, field in enumerate(fields):
+            field_name = field_names[index] if field_names is not None else self.resolve_field_name(field, class_name)
             
-            field_type = self.convert_avro_type_to_csharp(class_name, field_name, field['type'], parent_namespace)
+            field_type = field_types[index] if field_types is not None else self.convert_avro_type_to_csharp(class_name, field_name, field['type'], parent_namespace)
             
             # Handle special types that need custom hash code computation
             if field_type == 'byte[]' or field_type == 'byte[]?':
@@ -457,17 +575,17 @@ class AvroToCSharp:
         
         # HashCode.Combine supports up to 8 parameters
         if len(hash_fields) <= 8:
-            code += f"{INDENT*2}return HashCode.Combine({', '.join(hash_fields)});\n"
+            code.append(f"{INDENT*2}return HashCode.Combine({', '.join(hash_fields)});\n")
         else:
             # For more than 8 fields, use HashCode.Add
-            code += f"{INDENT*2}var hash = new HashCode();\n"
+            code.append(f"{INDENT*2}var hash = new HashCode();\n")
             for field in hash_fields:
-                code += f"{INDENT*2}hash.Add({field});\n"
-            code += f"{INDENT*2}return hash.ToHashCode();\n"
+                code.append(f"{INDENT*2}hash.Add({field});\n")
+            code.append(f"{INDENT*2}return hash.ToHashCode();\n")
         
-        code += f"{INDENT}}}\n"
+        code.append(f"{INDENT}}}\n")
         
-        return code
+        return "".join(code)
 
     def generate_enum(self, avro_schema: Dict, parent_namespace: str, write_file: bool) -> str:
         """ Generates an Enum """
@@ -479,6 +597,7 @@ class AvroToCSharp:
         ref = 'global::'+self.get_qualified_name(namespace, enum_name)
         if ref in self.generated_types:
             return ref
+        self.generated_types[ref] = "enum"
 
         enum_definition += f"/// <summary>\n/// {avro_schema.get('doc', enum_name )}\n/// </summary>\n"
 
@@ -489,186 +608,153 @@ class AvroToCSharp:
             else:
                 enum_definition += f"[XmlType(\"{enum_name}\")]\n"
 
+        symbol_template = f"{INDENT}/// <summary>\n{INDENT}/// {{0}}\n{INDENT}/// </summary>\n"
         if self.system_xml_annotation:
-            symbols_str = [f"{INDENT}/// <summary>\n{INDENT}/// {symbol}\n{INDENT}/// </summary>\n{INDENT}[XmlEnum(Name=\"{symbol}\")]\n{INDENT}{symbol}" for symbol in avro_schema['symbols']]
-        else:
-            symbols_str = [f"{INDENT}/// <summary>\n{INDENT}/// {symbol}\n{INDENT}/// </summary>\n{INDENT}{symbol}" for symbol in avro_schema['symbols']]
-        enum_body = ",\n".join(symbols_str)
+            symbol_template += f"{INDENT}[XmlEnum(Name=\"{{0}}\")]\n"
+        symbol_template += f"{INDENT}{{0}}"
+        enum_body = ",\n".join(map(symbol_template.format, avro_schema['symbols']))
         enum_definition += f"public enum {enum_name}\n{{\n{enum_body}\n}}"
 
         if write_file:
             self.write_to_file(namespace, enum_name, enum_definition)
-        ref = 'global::'+self.get_qualified_name(namespace, enum_name)
-        self.generated_types[ref] = "enum"
         self.generated_avro_types[ref] = avro_schema
         return ref
 
     def generate_embedded_union(self, class_name: str, field_name: str, avro_type: List, parent_namespace: str, write_file: bool) -> str:
         """ Generates an embedded Union Class """
 
-        class_definition_ctors = class_definition_decls = class_definition_read = ''
-        class_definition_write = class_definition = class_definition_toobject = ''
-        class_definition_objctr = class_definition_genericrecordctor = ''
+        ctors: List[str] = []
+        decls: List[str] = []
+        read: List[str] = []
+        write: List[str] = []
+        toobject: List[str] = []
+        objctr: List[str] = []
+        genericrecordctor: List[str] = []
         namespace = pascal(self.concat_namespace(self.base_namespace, parent_namespace))
         list_is_json_match: List [str] = []
         union_class_name = pascal(field_name)+'Union'
         ref = class_name+'.'+union_class_name
+        i2, i3, i4 = INDENT*2, INDENT*3, INDENT*4
 
         union_types = [self.convert_avro_type_to_csharp(class_name, field_name+"Option"+str(i), t, parent_namespace) for i,t in enumerate(avro_type)]
+        union_property_names: List[str] = []
         for i, union_type in enumerate(union_types):
             is_dict = is_list = False
             if union_type.startswith("Dictionary<"):
                 # get the type information from the dictionary
                 is_dict = True
-                match = re.findall(r"Dictionary<(.+)\s*,\s*(.+)>", union_type)
-                union_type_name = "Map" + pascal(match[0][1].rsplit('.', 1)[-1])
+                match = DICTIONARY_TYPE_PATTERN.match(union_type)
+                union_type_name = "Map" + pascal(match.group(2).rsplit('.', 1)[-1])
             elif union_type.startswith("List<"):
                 # get the type information from the list
                 is_list = True
-                match = re.findall(r"List<(.+)>", union_type)
-                union_type_name = "Array" + pascal(match[0].rsplit('.', 1)[-1])
+                match = LIST_TYPE_PATTERN.match(union_type)
+                union_type_name = "Array" + pascal(match.group(1).rsplit('.', 1)[-1])
             elif union_type == "byte[]":
                 union_type_name = "bytes"
             else:
                 union_type_name = union_type.rsplit('.', 1)[-1]
-            if self.is_csharp_reserved_word(union_type_name):
-                union_type_name = f"@{union_type_name}"
+                if self.is_csharp_reserved_word(union_type_name):
+                    union_type_name = f"@{union_type_name}"
+            union_property_names.append(union_type_name)
             proto_member_name = union_type_name[1:] if union_type_name.startswith("@") else union_type_name
-            class_definition_objctr += f"{INDENT*3}if (obj is {union_type})\n{INDENT*3}{{\n{INDENT*4}self.{union_type_name} = ({union_type})obj;\n{INDENT*4}return self;\n{INDENT*3}}}\n"
+            objctr.append(f"{i3}if (obj is {union_type})\n{i3}{{\n{i4}self.{union_type_name} = ({union_type})obj;\n{i4}return self;\n{i3}}}\n")
             if union_type in self.generated_types and self.generated_types[union_type] == "class":
-                class_definition_genericrecordctor += f"{INDENT*3}if (obj.Schema.Fullname == {union_type}.AvroSchema.Fullname)\n{INDENT*3}{{\n{INDENT*4}this.{union_type_name} = new {union_type}(obj);\n{INDENT*4}return;\n{INDENT*3}}}\n"
-            class_definition_ctors += \
-                f"{INDENT*2}/// <summary>\n{INDENT*2}/// Constructor for {union_type_name} values\n{INDENT*2}/// </summary>\n" + \
-                f"{INDENT*2}public {union_class_name}({union_type}? {union_type_name})\n{INDENT*2}{{\n{INDENT*3}this.{union_type_name} = {union_type_name};\n{INDENT*2}}}\n"
+                genericrecordctor.append(f"{i3}if (obj.Schema.Fullname == {union_type}.AvroSchema.Fullname)\n{i3}{{\n{i4}this.{union_type_name} = new {union_type}(obj);\n{i4}return;\n{i3}}}\n")
+            ctors.append(f"{i2}/// <summary>\n{i2}/// Constructor for {union_type_name} values\n{i2}/// </summary>\n")
+            ctors.append(f"{i2}public {union_class_name}({union_type}? {union_type_name})\n{i2}{{\n{i3}this.{union_type_name} = {union_type_name};\n{i2}}}\n")
+            decls.append(f"{i2}/// <summary>\n{i2}/// Gets the {union_type_name} value\n{i2}/// </summary>\n")
+            if self.protobuf_net_annotation:
+                decls.append(f"{i2}[ProtoMember({i+1}, Name=\"{proto_member_name}\")]\n")
             # Add Key attribute for MessagePack serialization if enabled
-            msgpack_key_attr = f"{INDENT*2}[Key({i})]\n" if self.msgpack_annotation else ""
-            class_definition_decls += \
-                f"{INDENT*2}/// <summary>\n{INDENT*2}/// Gets the {union_type_name} value\n{INDENT*2}/// </summary>\n" + \
-                (f"{INDENT*2}[ProtoMember({i+1}, Name=\"{proto_member_name}\")]\n" if self.protobuf_net_annotation else "") + \
-                msgpack_key_attr + \
-                f"{INDENT*2}public {union_type}? {union_type_name} {{ get; set; }} = null;\n"
-            class_definition_toobject += f"{INDENT*3}if ({union_type_name} != null) {{\n{INDENT*4}return {union_type_name};\n{INDENT*3}}}\n"
+            if self.msgpack_annotation:
+                decls.append(f"{i2}[Key({i})]\n")
+            decls.append(f"{i2}public {union_type}? {union_type_name} {{ get; set; }} = null;\n")
+            toobject.append(f"{i3}if ({union_type_name} != null) {{\n{i4}return {union_type_name};\n{i3}}}\n")
 
             if self.system_text_json_annotation:
-                if is_dict:
-                    class_definition_read += f"{INDENT*3}if (element.ValueKind == JsonValueKind.Object)\n{INDENT*3}{{\n" + \
-                            f"{INDENT*4}var map = System.Text.Json.JsonSerializer.Deserialize<{union_type}>(element, options);\n" + \
-                            f"{INDENT*4}if (map != null) {{ return new {union_class_name}(map); }} else {{ throw new NotSupportedException(); }};\n" + \
-                            f"{INDENT*3}}}\n"
-                elif is_list:
-                    class_definition_read += f"{INDENT*3}if (element.ValueKind == JsonValueKind.Array)\n{INDENT*3}{{\n" + \
-                            f"{INDENT*4}var map = System.Text.Json.JsonSerializer.Deserialize<{union_type}>(element, options);\n" + \
-                            f"{INDENT*4}if (map != null) {{ return new {union_class_name}(map); }} else {{ throw new NotSupportedException(); }};\n" + \
-                            f"{INDENT*3}}}\n"
+                if is_dict or is_list:
+                    read.append(f"{i3}if (element.ValueKind == JsonValueKind.{'Object' if is_dict else 'Array'})\n{i3}{{\n"
+                                f"{i4}var map = System.Text.Json.JsonSerializer.Deserialize<{union_type}>(element, options);\n"
+                                f"{i4}if (map != null) {{ return new {union_class_name}(map); }} else {{ throw new NotSupportedException(); }};\n"
+                                f"{i3}}}\n")
                 elif self.is_csharp_primitive_type(union_type):
                     if union_type == "byte[]":
-                        class_definition_read += f"{INDENT*3}if (element.ValueKind == JsonValueKind.String)\n{INDENT*3}{{\n{INDENT*4}return new {union_class_name}(element.GetBytesFromBase64());\n{INDENT*3}}}\n"
+                        read.append(f"{i3}if (element.ValueKind == JsonValueKind.String)\n{i3}{{\n{i4}return new {union_class_name}(element.GetBytesFromBase64());\n{i3}}}\n")
                     if union_type == "string":
-                        class_definition_read += f"{INDENT*3}if (element.ValueKind == JsonValueKind.String)\n{INDENT*3}{{\n{INDENT*4}return new {union_class_name}(element.GetString());\n{INDENT*3}}}\n"
+                        read.append(f"{i3}if (element.ValueKind == JsonValueKind.String)\n{i3}{{\n{i4}return new {union_class_name}(element.GetString());\n{i3}}}\n")
                     elif union_type in ['int', 'long', 'float', 'double', 'decimal', 'short', 'sbyte', 'ushort', 'uint', 'ulong']:
-                        class_definition_read += f"{INDENT*3}if (element.ValueKind == JsonValueKind.Number)\n{INDENT*3}{{\n{INDENT*4}return new {union_class_name}(element.Get{self.map_csharp_primitive_to_clr_type(union_type)}());\n{INDENT*3}}}\n"
+                        read.append(f"{i3}if (element.ValueKind == JsonValueKind.Number)\n{i3}{{\n{i4}return new {union_class_name}(element.Get{self.map_csharp_primitive_to_clr_type(union_type)}());\n{i3}}}\n")
                     elif union_type == "bool":
-                        class_definition_read += f"{INDENT*3}if (element.ValueKind == JsonValueKind.True || element.ValueKind == System.Text.Json.JsonValueKind.False)\n{INDENT*2}{{\n{INDENT*3}return new {union_class_name}(element.GetBoolean());\n{INDENT*3}}}\n"
+                        read.append(f"{i3}if (element.ValueKind == JsonValueKind.True || element.ValueKind == System.Text.Json.JsonValueKind.False)\n{i2}{{\n{i3}return new {union_class_name}(element.GetBoolean());\n{i3}}}\n")
                     elif union_type == "DateTime":
-                        class_definition_read += f"{INDENT*3}if (element.ValueKind == JsonValueKind.String)\n{INDENT*3}{{\n{INDENT*4}return new {union_class_name}(System.DateTime.Parse(element.GetString()));\n{INDENT*3}}}\n"
+                        read.append(f"{i3}if (element.ValueKind == JsonValueKind.String)\n{i3}{{\n{i4}return new {union_class_name}(System.DateTime.Parse(element.GetString()));\n{i3}}}\n")
                     elif union_type == "DateTimeOffset":
-                        class_definition_read += f"{INDENT*3}if (element.ValueKind == JsonValueKind.String)\n{INDENT*3}{{\n{INDENT*4}return new {union_class_name}(System.DateTimeOffset.Parse(element.GetString()));\n{INDENT*3}}}\n"
+                        read.append(f"{i3}if (element.ValueKind == JsonValueKind.String)\n{i3}{{\n{i4}return new {union_class_name}(System.DateTimeOffset.Parse(element.GetString()));\n{i3}}}\n")
                 else:
                     if union_type.startswith("global::"):
                         type_kind = self.generated_types[union_type] if union_type in self.generated_types else "class"
                         if type_kind == "class":
-                            class_definition_read += f"{INDENT*3}if ({union_type}.IsJsonMatch(element))\n{INDENT*3}{{\n{INDENT*4}return new {union_class_name}({union_type}.FromData(element, System.Net.Mime.MediaTypeNames.Application.Json));\n{INDENT*3}}}\n"
+                            read.append(f"{i3}if ({union_type}.IsJsonMatch(element))\n{i3}{{\n{i4}return new {union_class_name}({union_type}.FromData(element, System.Net.Mime.MediaTypeNames.Application.Json));\n{i3}}}\n")
                         elif type_kind == "enum":
-                            class_definition_read += f"{INDENT*3}if (element.ValueKind == JsonValueKind.String && Enum.TryParse<{union_type}>(element.GetString(), true, out _ ))\n{INDENT*3}{{\n{INDENT*4}return new {union_class_name}(Enum.Parse<{union_type}>(element.GetString()));\n{INDENT*3}}}\n"
-                class_definition_write += f"{INDENT*3}{'else ' if i>0 else ''}if (value.{union_type_name} != null)\n{INDENT*3}{{\n{INDENT*4}System.Text.Json.JsonSerializer.Serialize(writer, value.{union_type_name}, options);\n{INDENT*3}}}\n"
+                            read.append(f"{i3}if (element.ValueKind == JsonValueKind.String && Enum.TryParse<{union_type}>(element.GetString(), true, out _ ))\n{i3}{{\n{i4}return new {union_class_name}(Enum.Parse<{union_type}>(element.GetString()));\n{i3}}}\n")
+                write.append(f"{i3}{'else ' if i>0 else ''}if (value.{union_type_name} != null)\n{i3}{{\n{i4}System.Text.Json.JsonSerializer.Serialize(writer, value.{union_type_name}, options);\n{i3}}}\n")
                 gij = self.get_is_json_match_clause_type("element", class_name, union_type)
                 if gij:
                     list_is_json_match.append(gij)
 
-        class_definition = \
-            f"/// <summary>\n/// {class_name}. Type union resolver. \n/// </summary>\n" + \
-            f"public partial class {class_name}\n{{\n" + \
-            f"{INDENT}/// <summary>\n{INDENT}/// Union class for {field_name}\n{INDENT}/// </summary>\n"
+        parts: List[str] = [
+            f"/// <summary>\n/// {class_name}. Type union resolver. \n/// </summary>\n",
+            f"public partial class {class_name}\n{{\n",
+            f"{INDENT}/// <summary>\n{INDENT}/// Union class for {field_name}\n{INDENT}/// </summary>\n"]
         if self.system_xml_annotation:
-            class_definition += \
-                f"{INDENT}[XmlRoot(\"{union_class_name}\")]\n"
+            parts.append(f"{INDENT}[XmlRoot(\"{union_class_name}\")]\n")
         if self.msgpack_annotation:
-            class_definition += \
-                f"{INDENT}[MessagePackObject]\n"
+            parts.append(f"{INDENT}[MessagePackObject]\n")
         if self.system_text_json_annotation:
-            class_definition += \
-                f"{INDENT}[System.Text.Json.Serialization.JsonConverter(typeof({union_class_name}))]\n"
+            parts.append(f"{INDENT}[System.Text.Json.Serialization.JsonConverter(typeof({union_class_name}))]\n")
         if self.protobuf_net_annotation:
-            class_definition += f"{INDENT}[ProtoContract]\n"
-        class_definition += \
-            f"{INDENT}public sealed class {union_class_name}"
+            parts.append(f"{INDENT}[ProtoContract]\n")
+        parts.append(f"{INDENT}public sealed class {union_class_name}")
         if self.system_text_json_annotation:
-            class_definition += f": System.Text.Json.Serialization.JsonConverter<global::{namespace}.{class_name}.{union_class_name}>"
-        class_definition += f"\n{INDENT}{{\n" + \
-            f"{INDENT*2}/// <summary>\n{INDENT*2}/// Default constructor\n{INDENT*2}/// </summary>\n" + \
-            f"{INDENT*2}public {union_class_name}() {{ }}\n"
-        class_definition += class_definition_ctors
+            parts.append(f": System.Text.Json.Serialization.JsonConverter<global::{namespace}.{class_name}.{union_class_name}>")
+        parts.append(f"\n{INDENT}{{\n{i2}/// <summary>\n{i2}/// Default constructor\n{i2}/// </summary>\n{i2}public {union_class_name}() {{ }}\n")
+        parts.extend(ctors)
         if self.avro_annotation:
-            class_definition += \
-                f"{INDENT*2}/// <summary>\n{INDENT*2}/// Constructor for Avro decoder\n{INDENT*2}/// </summary>\n" + \
-                f"{INDENT*2}internal static {union_class_name} FromObject(object obj)\n{INDENT*2}{{\n"
-            if class_definition_genericrecordctor:
-                class_definition += \
-                    f"{INDENT*3}if (obj is global::Avro.Generic.GenericRecord)\n{INDENT*3}{{\n" + \
-                    f"{INDENT*4}return new {union_class_name}((global::Avro.Generic.GenericRecord)obj);\n" + \
-                    f"{INDENT*3}}}\n"
-            class_definition += \
-                f"{INDENT*3}var self = new {union_class_name}();\n" + \
-                class_definition_objctr + \
-                f"{INDENT*3}throw new NotSupportedException(\"No record type matched the type\");\n" + \
-                f"{INDENT*2}}}\n"
-            if class_definition_genericrecordctor:
-                class_definition += f"\n{INDENT*2}/// <summary>\n{INDENT*2}/// Constructor from Avro GenericRecord\n{INDENT*2}/// </summary>\n" + \
-                    f"{INDENT*2}public {union_class_name}(global::Avro.Generic.GenericRecord obj)\n{INDENT*2}{{\n" + \
-                    class_definition_genericrecordctor + \
-                    f"{INDENT*3}throw new NotSupportedException(\"No record type matched the type\");\n" + \
-                    f"{INDENT*2}}}\n"
-        class_definition += \
-            class_definition_decls + \
-            f"\n{INDENT*2}/// <summary>\n{INDENT*2}/// Yields the current value of the union\n{INDENT*2}/// </summary>\n" + \
-            f"\n{INDENT*2}public Object ToObject()\n{INDENT*2}{{\n" + \
-            class_definition_toobject+ \
-            f"{INDENT*3}throw new NotSupportedException(\"No record type is set in the union\");\n" + \
-            f"{INDENT*2}}}\n"
+            parts.append(f"{i2}/// <summary>\n{i2}/// Constructor for Avro decoder\n{i2}/// </summary>\n"
+                         f"{i2}internal static {union_class_name} FromObject(object obj)\n{i2}{{\n")
+            if genericrecordctor:
+                parts.append(f"{i3}if (obj is global::Avro.Generic.GenericRecord)\n{i3}{{\n"
+                             f"{i4}return new {union_class_name}((global::Avro.Generic.GenericRecord)obj);\n{i3}}}\n")
+            parts.append(f"{i3}var self = new {union_class_name}();\n")
+            parts.extend(objctr)
+            parts.append(f"{i3}throw new NotSupportedException(\"No record type matched the type\");\n{i2}}}\n")
+            if genericrecordctor:
+                parts.append(f"\n{i2}/// <summary>\n{i2}/// Constructor from Avro GenericRecord\n{i2}/// </summary>\n"
+                             f"{i2}public {union_class_name}(global::Avro.Generic.GenericRecord obj)\n{i2}{{\n")
+                parts.extend(genericrecordctor)
+                parts.append(f"{i3}throw new NotSupportedException(\"No record type matched the type\");\n{i2}}}\n")
+        parts.extend(decls)
+        parts.append(f"\n{i2}/// <summary>\n{i2}/// Yields the current value of the union\n{i2}/// </summary>\n"
+                     f"\n{i2}public Object ToObject()\n{i2}{{\n")
+        parts.extend(toobject)
+        parts.append(f"{i3}throw new NotSupportedException(\"No record type is set in the union\");\n{i2}}}\n")
         if self.system_text_json_annotation:
-            class_definition += \
-                f"\n{INDENT*2}/// <summary>\n{INDENT*2}/// Reads the JSON representation of the object.\n{INDENT*2}/// </summary>\n" + \
-                f"{INDENT*2}public override {union_class_name}? Read(ref Utf8JsonReader reader, System.Type typeToConvert, JsonSerializerOptions options)\n{INDENT*2}{{\n{INDENT*3}var element = JsonElement.ParseValue(ref reader);\n" + \
-                class_definition_read + \
-                f"{INDENT*3}throw new NotSupportedException(\"No record type matched the JSON data\");\n{INDENT*2}}}\n" + \
-                f"\n{INDENT*2}/// <summary>\n{INDENT*2}/// Writes the JSON representation of the object.\n{INDENT*2}/// </summary>\n" + \
-                f"{INDENT*2}public override void Write(Utf8JsonWriter writer, {union_class_name} value, JsonSerializerOptions options)\n{INDENT*2}{{\n" + \
-                class_definition_write + \
-                f"{INDENT*3}else\n{INDENT*3}{{\n{INDENT*4}throw new NotSupportedException(\"No record type is set in the union\");\n{INDENT*3}}}\n{INDENT*2}}}\n" + \
-                f"\n{INDENT*2}/// <summary>\n{INDENT*2}/// Checks if the JSON element matches the schema\n{INDENT*2}/// </summary>\n" + \
-                f"{INDENT*2}public static bool IsJsonMatch(System.Text.Json.JsonElement element)\n{INDENT*2}{{" + \
-                f"\n{INDENT*3}return "+f"\n{INDENT*3} || ".join(list_is_json_match)+f";\n{INDENT*2}}}\n"
-        
+            parts.append(f"\n{i2}/// <summary>\n{i2}/// Reads the JSON representation of the object.\n{i2}/// </summary>\n"
+                         f"{i2}public override {union_class_name}? Read(ref Utf8JsonReader reader, System.Type typeToConvert, JsonSerializerOptions options)\n{i2}{{\n{i3}var element = JsonElement.ParseValue(ref reader);\n")
+            parts.extend(read)
+            parts.append(f"{i3}throw new NotSupportedException(\"No record type matched the JSON data\");\n{i2}}}\n"
+                         f"\n{i2}/// <summary>\n{i2}/// Writes the JSON representation of the object.\n{i2}/// </summary>\n"
+                         f"{i2}public override void Write(Utf8JsonWriter writer, {union_class_name} value, JsonSerializerOptions options)\n{i2}{{\n")
+            parts.extend(write)
+            parts.append(f"{i3}else\n{i3}{{\n{i4}throw new NotSupportedException(\"No record type is set in the union\");\n{i3}}}\n{i2}}}\n"
+                         f"\n{i2}/// <summary>\n{i2}/// Checks if the JSON element matches the schema\n{i2}/// </summary>\n"
+                         f"{i2}public static bool IsJsonMatch(System.Text.Json.JsonElement element)\n{i2}{{"
+                         f"\n{i3}return " + f"\n{i3} || ".join(list_is_json_match) + f";\n{i2}}}\n")
+
         # Generate Equals and GetHashCode for the union class
-        # Build list of property names for comparison
-        union_property_names = []
-        for union_type in union_types:
-            if union_type.startswith("Dictionary<"):
-                match = re.findall(r"Dictionary<(.+)\s*,\s*(.+)>", union_type)
-                union_property_names.append("Map" + pascal(match[0][1].rsplit('.', 1)[-1]))
-            elif union_type.startswith("List<"):
-                match = re.findall(r"List<(.+)>", union_type)
-                union_property_names.append("Array" + pascal(match[0].rsplit('.', 1)[-1]))
-            elif union_type == "byte[]":
-                union_property_names.append("bytes")
-            else:
-                prop_name = union_type.rsplit('.', 1)[-1]
-                if self.is_csharp_reserved_word(prop_name):
-                    prop_name = f"@{prop_name}"
-                union_property_names.append(prop_name)
-        
         equals_conditions = " && ".join([f"Equals({name}, other.{name})" for name in union_property_names])
-        
+
         # HashCode.Combine only accepts up to 8 arguments, so we need to chain calls for larger unions
         def generate_hashcode_expression(props: list) -> str:
             if len(props) <= 8:
@@ -679,21 +765,21 @@ class AvroToCSharp:
                 remaining = props[7:]
                 inner = generate_hashcode_expression(remaining)
                 return f"HashCode.Combine({', '.join(first_batch)}, {inner})"
-        
+
         hashcode_expression = generate_hashcode_expression(union_property_names)
-        
-        class_definition += \
-            f"\n{INDENT*2}/// <summary>\n{INDENT*2}/// Determines whether the specified object is equal to the current object.\n{INDENT*2}/// </summary>\n" + \
-            f"{INDENT*2}public override bool Equals(object? obj)\n{INDENT*2}{{\n" + \
-            f"{INDENT*3}if (obj is not {union_class_name} other) return false;\n" + \
-            f"{INDENT*3}return {equals_conditions};\n" + \
-            f"{INDENT*2}}}\n" + \
-            f"\n{INDENT*2}/// <summary>\n{INDENT*2}/// Serves as the default hash function.\n{INDENT*2}/// </summary>\n" + \
-            f"{INDENT*2}public override int GetHashCode()\n{INDENT*2}{{\n" + \
-            f"{INDENT*3}return {hashcode_expression};\n" + \
-            f"{INDENT*2}}}\n"
-        
-        class_definition += f"{INDENT}}}\n}}"
+
+        parts.append(
+            f"\n{i2}/// <summary>\n{i2}/// Determines whether the specified object is equal to the current object.\n{i2}/// </summary>\n"
+            f"{i2}public override bool Equals(object? obj)\n{i2}{{\n"
+            f"{i3}if (obj is not {union_class_name} other) return false;\n"
+            f"{i3}return {equals_conditions};\n"
+            f"{i2}}}\n"
+            f"\n{i2}/// <summary>\n{i2}/// Serves as the default hash function.\n{i2}/// </summary>\n"
+            f"{i2}public override int GetHashCode()\n{i2}{{\n"
+            f"{i3}return {hashcode_expression};\n"
+            f"{i2}}}\n"
+            f"{INDENT}}}\n}}")
+        class_definition = "".join(parts)
 
         if write_file:
             self.write_to_file(namespace, class_name +"."+union_class_name, class_definition)
@@ -726,10 +812,12 @@ class AvroToCSharp:
         if isinstance(avro_type, str):
             if avro_type in ('null', 'boolean', 'int', 'long', 'float', 'double', 'bytes', 'string'):
                 return False
-            schema = self.schema_doc
-            name = avro_type.split('.')[-1]
-            namespace = ".".join(avro_type.split('.')[:-1])
-            return self.find_type('enum', schema, name, namespace) is not None
+            # the lookup walks the whole schema document, so the answer is kept per type name
+            is_enum = self.enum_type_cache.get(avro_type)
+            if is_enum is None:
+                namespace, _, name = avro_type.rpartition('.')
+                is_enum = self.enum_type_cache[avro_type] = self.find_type('enum', self.schema_doc, name, namespace) is not None
+            return is_enum
         elif isinstance(avro_type, list):
             # Check for nullable enum: ["null", <enum-type>] or [<enum-type>, "null"]
             non_null_types = [t for t in avro_type if t != 'null']
@@ -740,51 +828,48 @@ class AvroToCSharp:
             return avro_type.get('type') == 'enum'
         return False
 
-    def generate_property(self, field_index: int, field: Dict, class_name: str, parent_namespace: str) -> str:
+    def generate_property(self, field_index: int, field: Dict, class_name: str, parent_namespace: str, field_type: str | None = None, field_name: str | None = None) -> str:
         """ Generates a property """
         is_enum_type = self.is_enum_type(field['type'])
-        field_type = self.convert_avro_type_to_csharp(
-            class_name, field['name'], field['type'], parent_namespace)
+        if field_type is None:
+            field_type = self.convert_avro_type_to_csharp(
+                class_name, field['name'], field['type'], parent_namespace)
         field_default = field.get('const', field.get('default', None))
-        annotation_name = field_name = field['name']
-        if self.is_csharp_reserved_word(field_name):
-            field_name = f"@{field_name}"
-        if self.pascal_properties:
-            field_name = pascal(field_name)
-        if field_name == class_name:
-            field_name += "_"
-        prop = ''
-        prop += f"{INDENT}/// <summary>\n{INDENT}/// { field.get('doc', field_name) }\n{INDENT}/// </summary>\n"
+        annotation_name = field['name']
+        if field_name is None:
+            field_name = self.resolve_field_name(field, class_name)
+        prop: List[str] = []
+        prop.append(f"{INDENT}/// <summary>\n{INDENT}/// { field.get('doc', field_name) }\n{INDENT}/// </summary>\n")
         
         if self.protobuf_net_annotation:
-            prop += f"{INDENT}[ProtoMember({field_index}, Name=\"{annotation_name}\")]\n"
+            prop.append(f"{INDENT}[ProtoMember({field_index}, Name=\"{annotation_name}\")]\n")
         
         # Add XML serialization attribute if enabled
         if self.system_xml_annotation:
             xmlkind = field.get('xmlkind', 'element')
             if xmlkind == 'element':
-                prop += f"{INDENT}[XmlElement(\"{annotation_name}\")]\n"
+                prop.append(f"{INDENT}[XmlElement(\"{annotation_name}\")]\n")
             elif xmlkind == 'attribute':
-                prop += f"{INDENT}[XmlAttribute(\"{annotation_name}\")]\n"
+                prop.append(f"{INDENT}[XmlAttribute(\"{annotation_name}\")]\n")
         
         # Add MessagePack serialization attribute if enabled
         if self.msgpack_annotation:
-            prop += f"{INDENT}[Key({field_index})]\n"
+            prop.append(f"{INDENT}[Key({field_index})]\n")
 
         # Add CBOR serialization attribute if enabled
         if self.cbor_annotation:
-            prop += f"{INDENT}[Dahomey.Cbor.Attributes.CborProperty(\"{annotation_name}\")]\n"
+            prop.append(f"{INDENT}[Dahomey.Cbor.Attributes.CborProperty(\"{annotation_name}\")]\n")
 
         if self.system_text_json_annotation:
-            prop += f"{INDENT}[System.Text.Json.Serialization.JsonPropertyName(\"{annotation_name}\")]\n"
+            prop.append(f"{INDENT}[System.Text.Json.Serialization.JsonPropertyName(\"{annotation_name}\")]\n")
             if is_enum_type:
-                prop += f"{INDENT}[System.Text.Json.Serialization.JsonConverter(typeof(JsonStringEnumConverter))]\n"
+                prop.append(f"{INDENT}[System.Text.Json.Serialization.JsonConverter(typeof(JsonStringEnumConverter))]\n")
             if field_type.endswith("Union") and not field_type.startswith("global::"):
-                prop += f"{INDENT}[System.Text.Json.Serialization.JsonConverter(typeof({field_type}))]\n"
+                prop.append(f"{INDENT}[System.Text.Json.Serialization.JsonConverter(typeof({field_type}))]\n")
         if self.newtonsoft_json_annotation:
-            prop += f"{INDENT}[Newtonsoft.Json.JsonProperty(\"{annotation_name}\")]\n"
+            prop.append(f"{INDENT}[Newtonsoft.Json.JsonProperty(\"{annotation_name}\")]\n")
             if is_enum_type:
-                prop += f"{INDENT}[Newtonsoft.Json.JsonConverter(typeof(Newtonsoft.Json.Converters.StringEnumConverter))]\n"
+                prop.append(f"{INDENT}[Newtonsoft.Json.JsonConverter(typeof(Newtonsoft.Json.Converters.StringEnumConverter))]\n")
         
         # Determine initialization value
         initialization = ""
@@ -812,44 +897,30 @@ class AvroToCSharp:
             # Non-nullable custom reference types should be initialized with new instance
             initialization = " = new();"
         
-        prop += f"{INDENT}public {field_type} {field_name} {{ get; set; }}{initialization}"
-        return prop
+        prop.append(f"{INDENT}public {field_type} {field_name} {{ get; set; }}{initialization}")
+        return "".join(prop)
 
     def write_to_file(self, namespace: str, name: str, definition: str):
         """ Writes the class or enum to a file """
         directory_path = os.path.join(
             self.output_dir, os.path.join('src', namespace.replace('.', os.sep)))
-        if not os.path.exists(directory_path):
+        if directory_path not in self.known_directories:
             os.makedirs(directory_path, exist_ok=True)
+            self.known_directories.add(directory_path)
         file_path = os.path.join(directory_path, f"{name}.cs")
 
-        with open(file_path, 'w', encoding='utf-8') as file:
-            # Common using statements (add more as needed)
-            file_content = "using System;\nusing System.Collections.Generic;\n"
-            file_content += "using System.Linq;\n"
-            if self.protobuf_net_annotation:
-                file_content += "using ProtoBuf;\n"
-            if self.system_text_json_annotation:
-                file_content += "using System.Text.Json;\n"
-                file_content += "using System.Text.Json.Serialization;\n"
-            if self.newtonsoft_json_annotation:
-                file_content += "using Newtonsoft.Json;\n"
-            if self.system_xml_annotation:  # Add XML serialization using directive
-                file_content += "using System.Xml.Serialization;\n"
-            if self.msgpack_annotation:  # Add MessagePack serialization using directive
-                file_content += "using MessagePack;\n"
-            if self.cbor_annotation:  # Add CBOR serialization using directive
-                file_content += "using Dahomey.Cbor.Attributes;\n"
-
-            if namespace:
-                # Namespace declaration with correct indentation for the definition
-                file_content += f"\nnamespace {namespace}\n{{\n"
-                indented_definition = '\n'.join(
-                    [f"{INDENT}{line}" for line in definition.split('\n')])
-                file_content += f"{indented_definition}\n}}"
-            else:
-                file_content += definition
-            file.write(file_content)
+        file_content = [csharp_using_directives(
+            self.protobuf_net_annotation, self.system_text_json_annotation, self.newtonsoft_json_annotation,
+            self.system_xml_annotation, self.msgpack_annotation, self.cbor_annotation)]
+        if namespace:
+            # Namespace declaration with correct indentation for the definition
+            file_content.extend((f"\nnamespace {namespace}\n{{\n", INDENT, definition.replace('\n', '\n' + INDENT), "\n}"))
+        else:
+            file_content.append(definition)
+        # newline='' skips the per-write line ending translation; the generated sources use '\n' throughout
+        with open(file_path, 'w', encoding='utf-8', newline='') as file:
+            file.writelines(file_content)
+        self.written_files.append(file_path)
 
     def generate_tests(self, output_dir: str) -> None:
         """ Generates unit tests for all the generated C# classes and enums """
@@ -903,6 +974,7 @@ class AvroToCSharp:
         test_file_path = os.path.join(test_directory_path, f"{test_class_name}.cs")
         with open(test_file_path, 'w', encoding='utf-8') as test_file:
             test_file.write(test_class_definition)
+        self.written_files.append(test_file_path)
 
     def get_class_test_fields(self, avro_schema: Dict[str,JsonNode], class_name: str) -> List[Any]:
         """ Retrieves fields for a given class name """
@@ -1004,15 +1076,17 @@ class AvroToCSharp:
                 warnings.warn(f"No namespace provided, using '{project_name}' derived from output directory", UserWarning)
         
         self.schema_doc = schema
+        self.enum_type_cache = {}
         self.type_dict = build_flat_type_dict(self.schema_doc)
         if not os.path.exists(output_dir):
             os.makedirs(output_dir, exist_ok=True)
-        if not glob.glob(os.path.join(output_dir, "src", "*.sln")):
+        if not has_file_with_extension(os.path.join(output_dir, "src"), ".sln"):
             sln_file = os.path.join(
                 output_dir, f"{project_name}.sln")
             if not os.path.exists(sln_file):
                 if not os.path.exists(os.path.dirname(sln_file)):
                     os.makedirs(os.path.dirname(sln_file))
+                self.written_files.append(sln_file)
                 with open(sln_file, 'w', encoding='utf-8') as file:
                     file.write(process_template(
                         "avrotocsharp/project.sln.jinja", 
@@ -1022,12 +1096,13 @@ class AvroToCSharp:
                         system_xml_annotation=self.system_xml_annotation,
                         system_text_json_annotation=self.system_text_json_annotation,
                         newtonsoft_json_annotation=self.newtonsoft_json_annotation))
-        if not glob.glob(os.path.join(output_dir, "src", "*.csproj")):
+        if not has_file_with_extension(os.path.join(output_dir, "src"), ".csproj"):
             csproj_file = os.path.join(
                 output_dir, "src", f"{pascal(project_name)}.csproj")
             if not os.path.exists(csproj_file):
                 if not os.path.exists(os.path.dirname(csproj_file)):
                     os.makedirs(os.path.dirname(csproj_file))
+                self.written_files.append(csproj_file)
                 with open(csproj_file, 'w', encoding='utf-8') as file:
                     file.write(process_template(
                         "avrotocsharp/project.csproj.jinja",
@@ -1049,12 +1124,13 @@ class AvroToCSharp:
                         NUNIT_VERSION=NUNIT_VERSION,
                         NUNIT_ADAPTER_VERSION=NUNIT_ADAPTER_VERSION,
                         MSTEST_SDK_VERSION=MSTEST_SDK_VERSION))
-        if not glob.glob(os.path.join(output_dir, "test", "*.csproj")):
+        if not has_file_with_extension(os.path.join(output_dir, "test"), ".csproj"):
             csproj_test_file = os.path.join(
                 output_dir, "test", f"{pascal(project_name)}.Test.csproj")
             if not os.path.exists(csproj_test_file):
                 if not os.path.exists(os.path.dirname(csproj_test_file)):
                     os.makedirs(os.path.dirname(csproj_test_file))
+                self.written_files.append(csproj_test_file)
                 with open(csproj_test_file, 'w', encoding='utf-8') as file:
                     file.write(process_template(
                         "avrotocsharp/testproject.csproj.jinja", 
@@ -1072,6 +1148,7 @@ class AvroToCSharp:
         # Generate coverage scripts
         if not os.path.exists(os.path.join(output_dir, "run_coverage.ps1")):
             coverage_ps1_file = os.path.join(output_dir, "run_coverage.ps1")
+            self.written_files.append(coverage_ps1_file)
             with open(coverage_ps1_file, 'w', encoding='utf-8') as file:
                 file.write(process_template(
                     "avrotocsharp/run_coverage.ps1.jinja", 
@@ -1079,6 +1156,7 @@ class AvroToCSharp:
         
         if not os.path.exists(os.path.join(output_dir, "run_coverage.sh")):
             coverage_sh_file = os.path.join(output_dir, "run_coverage.sh")
+            self.written_files.append(coverage_sh_file)
             with open(coverage_sh_file, 'w', encoding='utf-8') as file:
                 file.write(process_template(
                     "avrotocsharp/run_coverage.sh.jinja", 
@@ -1092,6 +1170,7 @@ class AvroToCSharp:
         # Generate README with coverage documentation
         if not os.path.exists(os.path.join(output_dir, "README.md")):
             readme_file = os.path.join(output_dir, "README.md")
+            self.written_files.append(readme_file)
             with open(readme_file, 'w', encoding='utf-8') as file:
                 file.write(process_template(
                     "avrotocsharp/README.md.jinja", 
@@ -1104,11 +1183,75 @@ class AvroToCSharp:
 
     def convert(self, avro_schema_path: str, output_dir: str):
         """ Converts Avro schema to C# """
-        with open(avro_schema_path, 'r', encoding='utf-8') as file:
-            schema = json.load(file)
+        with open(avro_schema_path, 'rb') as file:
+            schema_bytes = file.read()
+        schema = load_json_document(schema_bytes)
         self.convert_schema(schema, output_dir)
 
 
+def convert_to_csharp(
+    source: Union[str, os.PathLike, JsonNode],
+    output_dir: str,
+    *,
+    is_schema_file: bool,
+    base_namespace: str = '',
+    project_name: str = '',
+    pascal_properties: bool = False,
+    system_text_json_annotation: bool = False,
+    newtonsoft_json_annotation: bool = False,
+    system_xml_annotation: bool = False,
+    msgpack_annotation: bool = False,
+    cbor_annotation: bool = False,
+    avro_annotation: bool = False,
+    protobuf_net_annotation: bool = False,
+    skip_unchanged: bool = False
+):
+    """Converts an Avro schema file or an in-memory Avro schema to C# classes
+
+    Args:
+        source (str | os.PathLike | JsonNode): Avro input schema path, or the Avro schema itself
+        output_dir (str): Output directory
+        is_schema_file (bool): Whether source is a schema file path. A str source is otherwise taken as a schema,
+            such as the primitive schema "string".
+        base_namespace (str, optional): Base namespace. For schema files it defaults to the output directory name.
+        project_name (str, optional): Explicit project name for .csproj files (separate from namespace). Defaults to ''.
+        pascal_properties (bool, optional): Pascal case properties. Defaults to False.
+        system_text_json_annotation (bool, optional): Use System.Text.Json annotations. Defaults to False.
+        newtonsoft_json_annotation (bool, optional): Use Newtonsoft.Json annotations. Defaults to False.
+        system_xml_annotation (bool, optional): Use System.Xml.Serialization annotations. Defaults to False.
+        msgpack_annotation (bool, optional): Use MessagePack annotations. Defaults to False.
+        cbor_annotation (bool, optional): Use Dahomey.Cbor annotations. Defaults to False.
+        avro_annotation (bool, optional): Use Avro annotations. Defaults to False.
+        protobuf_net_annotation (bool, optional): Use protobuf-net annotations. Defaults to False.
+        skip_unchanged (bool, optional): For in-memory schemas, record the generated files in a manifest in the
+            output directory and skip the conversion if they are unmodified output of the same schema and options.
+            Defaults to False.
+    """
+    if is_schema_file:
+        if not base_namespace:
+            base_namespace = os.path.splitext(os.path.basename(output_dir))[0].replace('-', '_')
+    cache_key = None
+    if not is_schema_file and skip_unchanged:
+        # without a base namespace, the namespace is derived from the output directory name
+        project_dir_name = os.path.basename(os.path.abspath(output_dir))
+        cache_key = schema_cache_key(source, base_namespace or project_dir_name, project_name, (
+            pascal_properties, system_text_json_annotation, newtonsoft_json_annotation, system_xml_annotation,
+            msgpack_annotation, cbor_annotation, avro_annotation, protobuf_net_annotation))
+        if cache_key and is_cached_output_current(output_dir, cache_key):
+            return
+    avrotocs = AvroToCSharp(
+        base_namespace, project_name=project_name, pascal_properties=pascal_properties,
+        system_text_json_annotation=system_text_json_annotation, newtonsoft_json_annotation=newtonsoft_json_annotation,
+        system_xml_annotation=system_xml_annotation, msgpack_annotation=msgpack_annotation, cbor_annotation=cbor_annotation,
+        avro_annotation=avro_annotation, protobuf_net_annotation=protobuf_net_annotation)
+    if is_schema_file:
+        avrotocs.convert(os.fspath(cast(Union[str, os.PathLike], source)), output_dir)
+    else:
+        avrotocs.convert_schema(source, output_dir)
+        if cache_key:
+            write_schema_cache(output_dir, cache_key, avrotocs.written_files)
+
+
 def convert_avro_to_csharp(
     avro_schema_path, 
     cs_file_path, 
@@ -1139,20 +1282,13 @@ def convert_avro_to_csharp(
         avro_annotation (bool, optional): Use Avro annotations. Defaults to False.
         protobuf_net_annotation (bool, optional): Use protobuf-net annotations. Defaults to False.
     """
-
-    if not base_namespace:
-        base_namespace = os.path.splitext(os.path.basename(cs_file_path))[0].replace('-', '_')
-    avrotocs = AvroToCSharp(base_namespace)
-    avrotocs.project_name = project_name
-    avrotocs.pascal_properties = pascal_properties
-    avrotocs.system_text_json_annotation = system_text_json_annotation
-    avrotocs.newtonsoft_json_annotation = newtonsoft_json_annotation
-    avrotocs.system_xml_annotation = system_xml_annotation
-    avrotocs.msgpack_annotation = msgpack_annotation
-    avrotocs.cbor_annotation = cbor_annotation
-    avrotocs.avro_annotation = avro_annotation
-    avrotocs.protobuf_net_annotation = protobuf_net_annotation
-    avrotocs.convert(avro_schema_path, cs_file_path)
+    convert_to_csharp(
+        avro_schema_path, cs_file_path, is_schema_file=True,
+        base_namespace=base_namespace, project_name=project_name,
+        pascal_properties=pascal_properties, system_text_json_annotation=system_text_json_annotation,
+        newtonsoft_json_annotation=newtonsoft_json_annotation, system_xml_annotation=system_xml_annotation,
+        msgpack_annotation=msgpack_annotation, cbor_annotation=cbor_annotation,
+        avro_annotation=avro_annotation, protobuf_net_annotation=protobuf_net_annotation)
 
 
 def convert_avro_schema_to_csharp(
@@ -1167,7 +1303,8 @@ def convert_avro_schema_to_csharp(
     msgpack_annotation: bool = False,
     cbor_annotation: bool = False,
     avro_annotation: bool = False,
-    protobuf_net_annotation: bool = False
+    protobuf_net_annotation: bool = False,
+    skip_unchanged: bool = False
 ):
     """Converts Avro schema to C# classes
 
@@ -1184,15 +1321,14 @@ def convert_avro_schema_to_csharp(
         cbor_annotation (bool, optional): Use Dahomey.Cbor annotations. Defaults to False.
         avro_annotation (bool, optional): Use Avro annotations. Defaults to False.
         protobuf_net_annotation (bool, optional): Use protobuf-net annotations. Defaults to False.
+        skip_unchanged (bool, optional): Skip the conversion if output_dir holds unmodified output of the same
+            schema and options, tracked in a manifest file. Defaults to False.
     """
-    avrotocs = AvroToCSharp(base_namespace)
-    avrotocs.project_name = project_name
-    avrotocs.pascal_properties = pascal_properties
-    avrotocs.system_text_json_annotation = system_text_json_annotation
-    avrotocs.newtonsoft_json_annotation = newtonsoft_json_annotation
-    avrotocs.system_xml_annotation = system_xml_annotation
-    avrotocs.msgpack_annotation = msgpack_annotation
-    avrotocs.cbor_annotation = cbor_annotation
-    avrotocs.avro_annotation = avro_annotation
-    avrotocs.protobuf_net_annotation = protobuf_net_annotation
-    avrotocs.convert_schema(avro_schema, output_dir)
+    convert_to_csharp(
+        avro_schema, output_dir, is_schema_file=False,
+        base_namespace=base_namespace, project_name=project_name,
+        pascal_properties=pascal_properties, system_text_json_annotation=system_text_json_annotation,
+        newtonsoft_json_annotation=newtonsoft_json_annotation, system_xml_annotation=system_xml_annotation,
+        msgpack_annotation=msgpack_annotation, cbor_annotation=cbor_annotation,
+        avro_annotation=avro_annotation, protobuf_net_annotation=protobuf_net_annotation,
+        skip_unchanged=skip_unchanged)
@@ -214,6 +214,16 @@ else if ( mediaType.equals("avro/json") || mediaType.equals("application/vnd.apa
 """
 
 
+# the media type templates are indented once at import; only {typeName} is substituted per class
+PREAMBLE_TOBYTEARRAY_INDENTED = f'\n{INDENT*2}'.join(PREAMBLE_TOBYTEARRAY.split("\n"))
+EPILOGUE_TOBYTEARRAY_COMPRESSION_INDENTED = f'\n{INDENT*2}'.join(EPILOGUE_TOBYTEARRAY_COMPRESSION.split("\n"))
+EPILOGUE_TOBYTEARRAY_INDENTED = f'\n{INDENT*2}'.join(EPILOGUE_TOBYTEARRAY.strip().split("\n"))
+PREAMBLE_FROMDATA_COMPRESSION_INDENTED = f'\n{INDENT*2}'.join(PREAMBLE_FROMDATA_COMPRESSION.split("\n"))
+JSON_FROMDATA_INDENTED = f'\n{INDENT*2}' + f'\n{INDENT*2}'.join(JSON_FROMDATA.strip().split("\n"))
+JSON_TOBYTEARRAY_INDENTED = f'\n{INDENT*2}' + f'\n{INDENT*2}'.join(JSON_TOBYTEARRAY.strip().split("\n"))
+AVRO_FROMDATA_INDENTED = f'\n{INDENT*2}' + f'\n{INDENT*2}'.join(AVRO_FROMDATA.strip().split("\n"))
+AVRO_TOBYTEARRAY_INDENTED = f'\n{INDENT*2}' + f'\n{INDENT*2}'.join(AVRO_TOBYTEARRAY.strip().split("\n"))
+
 JsonNode = Dict[str, 'JsonNode'] | List['JsonNode'] | str | None
 
 
@@ -225,6 +235,11 @@ def flatten_type_name(name: str) -> str:
     return base_name
 
 
+def java_string_literal_body(text: str, indent: str) -> str:
+    """Splits text into 80-character string literal segments and escapes the quotes of each segment"""
+    return f"\"+\n{indent}\"".join(text[i:i+80].replace('"', '\\"') for i in range(0, len(text), 80))
+
+
 def is_java_reserved_word(word: str) -> bool:
     """Checks if a word is a Java reserved word"""
     reserved_words = [
@@ -518,10 +533,7 @@ class AvroToJava:
                 # Generate a method for each chunk
                 for i, chunk in enumerate(chunks):
                     # Use the same escaping technique as the non-chunked version
-                    escaped_chunk = chunk.replace('"', '§')
-                    escaped_chunk = f"\"+\n{INDENT*2}\"".join(
-                        [escaped_chunk[j:j+80] for j in range(0, len(escaped_chunk), 80)])
-                    escaped_chunk = escaped_chunk.replace('§', '\\"')
+                    escaped_chunk = java_string_literal_body(chunk, INDENT*2)
                     class_definition += f"\n\n{INDENT}private static String getAvroSchemaPart{i}() {{\n"
                     class_definition += f"{INDENT*2}return \"{escaped_chunk}\";\n"
                     class_definition += f"{INDENT}}}"
@@ -534,10 +546,7 @@ class AvroToJava:
                 class_definition += f"{INDENT}}}\n"
                 class_definition += f"\n{INDENT}public static final Schema AVROSCHEMA = new Schema.Parser().parse(getAvroSchemaJson());"
             else:
-                avro_schema_json = avro_schema_json.replace('"', '§')
-                avro_schema_json = f"\"+\n{INDENT}\"".join(
-                    [avro_schema_json[i:i+80] for i in range(0, len(avro_schema_json), 80)])
-                avro_schema_json = avro_schema_json.replace('§', '\\"')
+                avro_schema_json = java_string_literal_body(avro_schema_json, INDENT)
                 class_definition += f"\n\n{INDENT}public static final Schema AVROSCHEMA = new Schema.Parser().parse(\n{INDENT}\"{avro_schema_json}\");"
             
             # Store the schema for tracking
@@ -560,17 +569,15 @@ class AvroToJava:
             f"{ JSON_TOBYTEARRAY_THROWS if self.jackson_annotations else '' }" + \
             f"{ AVRO_TOBYTEARRAY_THROWS if self.avro_annotation else '' }  {{"
         if self.jackson_annotations or self.avro_annotation:
-            class_definition += f'\n{INDENT*2}'.join((PREAMBLE_TOBYTEARRAY).split("\n"))
+            class_definition += PREAMBLE_TOBYTEARRAY_INDENTED
         if self.avro_annotation:
-            class_definition += f'\n{INDENT*2}'+f'\n{INDENT*2}'.join(
-                AVRO_TOBYTEARRAY.strip().replace("{typeName}", class_name).split("\n"))
+            class_definition += AVRO_TOBYTEARRAY_INDENTED.replace("{typeName}", class_name)
         if self.jackson_annotations:
-            class_definition += f'\n{INDENT*2}'+f'\n{INDENT*2}'.join(
-                JSON_TOBYTEARRAY.strip().replace("{typeName}", class_name).split("\n"))
+            class_definition += JSON_TOBYTEARRAY_INDENTED
         if self.avro_annotation or self.jackson_annotations:
-            class_definition += f'\n{INDENT*2}'.join(EPILOGUE_TOBYTEARRAY_COMPRESSION.split("\n"))
+            class_definition += EPILOGUE_TOBYTEARRAY_COMPRESSION_INDENTED
             class_definition += f'\n{INDENT*2}if ( result != null ) {{ return result; }}'        
-        class_definition += (f'\n{INDENT*2}'.join((EPILOGUE_TOBYTEARRAY.strip()).split("\n")))+f"\n{INDENT}}}"
+        class_definition += EPILOGUE_TOBYTEARRAY_INDENTED+f"\n{INDENT}}}"
 
         # emit fromData factory method
         class_definition += f"\n\n{INDENT}/**\n{INDENT} * Converts the data to an object\n{INDENT} * @param data the data to convert\n{INDENT} * @param contentType the content type of the data\n{INDENT} * @return the object\n{INDENT} */\n"
@@ -581,13 +588,11 @@ class AvroToJava:
         
         if self.avro_annotation or self.jackson_annotations:
             class_definition += f'\n{INDENT*2}String mediaType = contentType.split(";")[0].trim().toLowerCase();'
-            class_definition += f'\n{INDENT*2}'.join((PREAMBLE_FROMDATA_COMPRESSION).split("\n"))
+            class_definition += PREAMBLE_FROMDATA_COMPRESSION_INDENTED
         if self.avro_annotation:
-            class_definition += f'\n{INDENT*2}'+f'\n{INDENT*2}'.join(
-                AVRO_FROMDATA.strip().replace("{typeName}", class_name).split("\n"))
+            class_definition += AVRO_FROMDATA_INDENTED.replace("{typeName}", class_name)
         if self.jackson_annotations:
-            class_definition += f'\n{INDENT*2}'+f'\n{INDENT*2}'.join(
-                JSON_FROMDATA.strip().replace("{typeName}", class_name).split("\n"))
+            class_definition += JSON_FROMDATA_INDENTED.replace("{typeName}", class_name)
         class_definition += f"\n{INDENT*2}throw new UnsupportedOperationException(\"Unsupported media type \"+ contentType);\n{INDENT}}}"
         
         if self.jackson_annotations:
@@ -1271,10 +1276,7 @@ class AvroToJava:
                 enum_schema['doc'] = avro_schema['doc']
             
             enum_schema_json = json.dumps(enum_schema)
-            enum_schema_json = enum_schema_json.replace('"', '§')
-            enum_schema_json = f"\"+\n{INDENT}\"".join(
-                [enum_schema_json[i:i+80] for i in range(0, len(enum_schema_json), 80)])
-            enum_schema_json = enum_schema_json.replace('§', '\\"')
+            enum_schema_json = java_string_literal_body(enum_schema_json, INDENT)
             
             enum_definition += f"\n{INDENT}public static final Schema SCHEMA = new Schema.Parser().parse(\n{INDENT}\"{enum_schema_json}\");\n"
         
@@ -6,6 +6,7 @@ Common utility functions for Avrotize.
 
 from collections import defaultdict
 import copy
+import functools
 import os
 import re
 import hashlib
@@ -14,17 +15,29 @@ from typing import Dict, Union, Any, List
 from jsoncomparison import NO_DIFF, Compare
 import jinja2
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional, faster JSON parser
+    orjson = None
 
+INVALID_NAME_CHARS = re.compile(r'[^a-zA-Z0-9_]')
+INVALID_NAMESPACE_CHARS = re.compile(r'[^a-zA-Z0-9_\.]')
+LEADING_DIGIT = re.compile(r'^[0-9]')
+LEADING_NAME_CHAR = re.compile(r'^[a-zA-Z_]')
+
+
+# typed, so that True and 1 are not served from the same cache entry
+@functools.lru_cache(maxsize=8192, typed=True)
 def avro_name(name):
     """Convert a name into an Avro name."""
     if isinstance(name, int):
         name = '_'+str(name)
-    val = re.sub(r'[^a-zA-Z0-9_]', '_', name)
+    val = INVALID_NAME_CHARS.sub('_', name)
     # Ensure the name starts with a letter or underscore (required for valid identifiers)
-    if re.match(r'^[0-9]', val):
+    if LEADING_DIGIT.match(val):
         val = '_' + val
     # Additional check to ensure we always have a valid identifier
-    if not val or not re.match(r'^[a-zA-Z_]', val):
+    if not val or not LEADING_NAME_CHAR.match(val):
         val = '_' + val
     return val
 
@@ -54,12 +67,32 @@ def avro_name_with_altname(name):
 
 def avro_namespace(name):
     """Convert a name into an Avro name."""
-    val = re.sub(r'[^a-zA-Z0-9_\.]', '_', name)
-    if re.match(r'^[0-9]', val):
+    val = INVALID_NAMESPACE_CHARS.sub('_', name)
+    if LEADING_DIGIT.match(val):
         val = '_' + val
     return val
 
 
+def load_json_document(content: str | bytes) -> Any:
+    """
+    Parses a JSON document the way json.loads does, using orjson when it is installed.
+
+    Args:
+        content (str | bytes): The JSON text to parse.
+
+    Returns:
+        Any: The parsed document.
+
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # e.g. NaN, integers beyond 64 bits or a UTF-8 BOM, which json still accepts
+            pass
+    return json.loads(content)
+
+
 def generic_type() -> list[str | dict]:
     """ 
     Constructs a generic Avro type for simple types, arrays, and maps.
@@ -110,6 +110,7 @@ def inline_dependencies_of(avro_schema, record):
         del record['dependencies']
 
     adjust_resolved_dependencies(record)
+    move_definitions_ahead_of_references(record, avro_schema)
 
     
 
@@ -133,6 +134,8 @@ def sort_messages_by_dependencies(avro_schema):
         return avro_schema
 
     sorted_messages = []
+    # qualified names of the records emitted so far, kept in step with sorted_messages
+    sorted_names = set()
     record_stack = []
     while avro_schema:
         found = False
@@ -144,11 +147,12 @@ def sort_messages_by_dependencies(avro_schema):
             
             # if this record is not a dependency of any other record, it can be safely emitted now
             #if not any(record.get('namespace','')+'.'+record.get('name') in other_record.get('dependencies', []) for other_record in [x for x in avro_schema if isinstance(x, dict) and 'name' in x]):
-            remaining_deps = [dep for dep in record['dependencies'] if not dep in [x.get('namespace','')+'.'+x.get('name','') for x in sorted_messages]] if 'dependencies' in record else []
+            remaining_deps = [dep for dep in record['dependencies'] if not dep in sorted_names] if 'dependencies' in record else []
             if len(remaining_deps) == 0:
                 if 'dependencies' in record:
                     del record['dependencies']
                 sorted_messages.append(record)
+                sorted_names.add(record.get('namespace','')+'.'+record.get('name',''))
                 avro_schema.remove(record)
                 found = True
                 
@@ -158,7 +162,7 @@ def sort_messages_by_dependencies(avro_schema):
             found = False
             for record in avro_schema:
                 if isinstance(record, dict) and 'dependencies' in record:
-                    remaining_deps = [dep for dep in record['dependencies'] if not dep in [x.get('namespace','')+'.'+x.get('name','') for x in sorted_messages]]
+                    remaining_deps = [dep for dep in record['dependencies'] if not dep in sorted_names]
                     if len(remaining_deps) > 0:
                         swap_record_dependencies(avro_schema, record, [record.get('namespace','')+'.'+record['name']], 0)
                         if 'dependencies' in record and len(record['dependencies']) == 0:
@@ -166,11 +170,12 @@ def sort_messages_by_dependencies(avro_schema):
                         if isinstance(record, dict) and not 'dependencies' in record:
                             found = True
                             sorted_messages.append(record)
+                            sorted_names.add(record.get('namespace','')+'.'+record.get('name',''))
                             if record in avro_schema:
                                 avro_schema.remove(record)
                             break
                         else:
-                            remaining_remaining_deps = [dep for dep in record['dependencies'] if not dep in [x.get('namespace')+'.'+x.get('name') for x in sorted_messages]]
+                            remaining_remaining_deps = [dep for dep in record['dependencies'] if not dep in sorted_names]
                             found = len(remaining_deps) != len(remaining_remaining_deps)
                             if found:
                                 break
@@ -346,3 +351,104 @@ def swap_dependency_type(avro_schema, field, dependency, dependency_type, depend
             if isinstance(dep_field, dict):
                 swap_dependency_type(avro_schema, dep_field, dependency, dependency_type, dependencies, record_stack, recursion_depth + 1)  
         record_stack.pop()
+
+
+PRIMITIVE_TYPES = frozenset(['null', 'boolean', 'int', 'long', 'float', 'double', 'bytes', 'string'])
+NAMED_TYPES = frozenset(['record', 'error', 'enum', 'fixed'])
+
+
+def move_definitions_ahead_of_references(record, avro_schema=None):
+    """
+    Inlining may leave a reference to a named type ahead of the place where the 
+    type got inlined, or may not inline a referenced type at all. Avro parsers read 
+    a schema front to back and reject such references, so this moves each affected 
+    definition up to the first reference, leaving the qualified name in its prior 
+    place, or inlines a copy of the definition from avro_schema.
+    """
+    unresolved = set()
+    while True:
+        forward_reference = find_forward_reference(record, unresolved)
+        if not forward_reference:
+            break
+        ref_parent, ref_key, qname = forward_reference
+        definition = locate_named_type(record, qname)
+        if definition:
+            def_parent, def_key, def_namespace = definition
+            named_type = def_parent[def_key]
+            def_parent[def_key] = qname
+        else:
+            definition = locate_named_type(avro_schema, qname) if avro_schema else None
+            if not definition:
+                # the type is not defined anywhere, nothing we can move
+                unresolved.add(qname)
+                continue
+            def_parent, def_key, def_namespace = definition
+            named_type = copy.deepcopy(def_parent[def_key])
+            # types the record already defines must not be defined a second time by the copy
+            record_types = set(named_type_scope(t, ns)[0] for t, _, _, ns in iterate_type_slots(record, None, None, '') if is_named_type(t))
+            for nested_type, parent, key, namespace in list(iterate_type_slots(named_type, None, None, def_namespace)):
+                if parent is not None and is_named_type(nested_type) and named_type_scope(nested_type, namespace)[0] in record_types:
+                    parent[key] = named_type_scope(nested_type, namespace)[0]
+        if not '.' in named_type['name'] and not 'namespace' in named_type and def_namespace:
+            named_type['namespace'] = def_namespace
+        ref_parent[ref_key] = named_type
+
+
+def is_named_type(avro_type) -> bool:
+    """ check whether avro_type is a record, enum or fixed definition """
+    return isinstance(avro_type, dict) and avro_type.get('type') in NAMED_TYPES and 'name' in avro_type
+
+
+def qualify_type_name(name: str, namespace: str) -> str:
+    """ resolve a type name against the enclosing namespace """
+    return name if '.' in name or not namespace else namespace + '.' + name
+
+
+def named_type_scope(avro_type: dict, namespace: str):
+    """ returns the qualified name of a named type and the namespace it sets for its children """
+    name = avro_type['name']
+    if '.' in name:
+        return name, name.rsplit('.', 1)[0]
+    namespace = avro_type.get('namespace', namespace)
+    return qualify_type_name(name, namespace), namespace
+
+
+def iterate_type_slots(avro_type, parent, key, namespace: str):
+    """ yields every type in avro_type with its parent, key and enclosing namespace, in schema parse order """
+    yield avro_type, parent, key, namespace
+    if isinstance(avro_type, list):
+        for i, item in enumerate(avro_type):
+            yield from iterate_type_slots(item, avro_type, i, namespace)
+    elif isinstance(avro_type, dict):
+        type_kind = avro_type.get('type')
+        if is_named_type(avro_type):
+            _, child_namespace = named_type_scope(avro_type, namespace)
+            for field in avro_type.get('fields', []):
+                yield from iterate_type_slots(field.get('type'), field, 'type', child_namespace)
+        elif type_kind == 'array':
+            yield from iterate_type_slots(avro_type.get('items'), avro_type, 'items', namespace)
+        elif type_kind == 'map':
+            yield from iterate_type_slots(avro_type.get('values'), avro_type, 'values', namespace)
+        else:
+            yield from iterate_type_slots(type_kind, avro_type, 'type', namespace)
+
+
+def find_forward_reference(record, known_types: set):
+    """ find the first reference to a type that has not been defined before it """
+    defined = set(known_types)
+    for avro_type, parent, key, namespace in iterate_type_slots(record, None, None, ''):
+        if is_named_type(avro_type):
+            defined.add(named_type_scope(avro_type, namespace)[0])
+        elif isinstance(avro_type, str) and parent is not None and not avro_type in PRIMITIVE_TYPES:
+            qname = qualify_type_name(avro_type, namespace)
+            if not qname in defined:
+                return parent, key, qname
+    return None
+
+
+def locate_named_type(avro_schema, qname: str):
+    """ find the definition of the named type qname and return its parent, key and enclosing namespace """
+    for avro_type, parent, key, namespace in iterate_type_slots(avro_schema, None, None, ''):
+        if parent is not None and is_named_type(avro_type) and named_type_scope(avro_type, namespace)[0] == qname:
+            return parent, key, namespace
+    return None
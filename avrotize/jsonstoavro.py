@@ -5,6 +5,7 @@
 import json
 import os
 import copy
+import sys
 import urllib
 from urllib.parse import ParseResult, urlparse, unquote
 from typing import Any, Dict, List, Tuple
@@ -12,11 +13,43 @@ import jsonpointer
 from jsonpointer import JsonPointerException
 import requests
 
-from avrotize.common import avro_name, avro_namespace, find_schema_node, generic_type, set_schema_node
+from avrotize.common import avro_name, avro_namespace, find_schema_node, generic_type, load_json_document, set_schema_node
 from avrotize.dependency_resolver import inline_dependencies_of, sort_messages_by_dependencies
 
 primitive_types = ['null', 'string', 'int',
                    'long', 'float', 'double', 'boolean', 'bytes']
+conditional_keywords = frozenset(
+    ['if', 'then', 'else', 'dependentSchemas', 'dependentRequired'])
+composition_keywords = frozenset(['allOf', 'oneOf', 'anyOf'])
+definition_keywords = frozenset(['type', 'allOf', 'oneOf', 'anyOf', 'properties', 'enum', '$ref', 'additionalProperties', 'patternProperties'])
+avro_date_type = {'type': 'int', 'logicalType': 'date'}
+avro_time_millis_type = {'type': 'int', 'logicalType': 'time-millis'}
+avro_duration_type = {'type': 'fixed', 'size': 12, 'logicalType': 'duration'}
+avro_uuid_type = {'type': 'string', 'logicalType': 'uuid'}
+json_primitive_types = {'string': 'string', 'integer': 'int',
+                        'number': 'float', 'boolean': 'boolean'}
+format_logical_types = {'date-time': avro_date_type, 'date': avro_date_type, 'time': avro_time_millis_type,
+                        'duration': avro_duration_type, 'uuid': avro_uuid_type}
+is_windows = os.name == 'nt'
+
+
+def file_url_to_path(parsed_url: ParseResult) -> str:
+    """
+    Converts a parsed file URL into a file system path.
+
+    Args:
+        parsed_url (ParseResult): The parsed file URL.
+
+    Returns:
+        str: The file system path.
+
+    """
+    # Remove the leading 'file://' from the path for compatibility
+    file_path = parsed_url.netloc or parsed_url.path
+    # On Windows, a file URL might start with a '/' but it's not part of the actual path
+    if is_windows and file_path.startswith('/'):
+        file_path = file_path[1:]
+    return file_path
 
 
 class JsonToAvroConverter:
@@ -29,6 +62,15 @@ class JsonToAvroConverter:
     max_recursion_depth: The maximum recursion depth.
     types_with_unmerged_types: A list of types with unmerged types.
     content_cache: A dictionary for caching fetched URLs.
+    http_session: The HTTP session used to fetch remote references, created on first use.
+    parsed_uri_cache: A dictionary for caching parsed $ref URIs.
+    json_pointer_cache: A dictionary for caching compiled JSON pointers.
+    composed_uri_cache: A dictionary for caching URIs composed from a base URI and a $ref.
+    composed_namespace_cache: A dictionary for caching namespaces and qualified names composed from their parts.
+    indexed_schema: The Avro schema list of the current conversion, which is indexed by name.
+    named_type_index: A dictionary mapping (namespace, name) to the position of a type in indexed_schema.
+    type_name_index: A dictionary mapping a name to the position of the first type with that name in indexed_schema.
+    indexed_count: The number of entries of indexed_schema that are in the indexes.
     utility_namespace: The namespace for utility types.
     maximize_compatiblity: A flag to maximize compatibility.
 
@@ -40,6 +82,15 @@ class JsonToAvroConverter:
         self.max_recursion_depth = 40
         self.types_with_unmerged_types: List[dict] = []
         self.content_cache: Dict[str, str] = {}
+        self.http_session: requests.Session | None = None
+        self.parsed_uri_cache: Dict[str, ParseResult] = {}
+        self.json_pointer_cache: Dict[str, jsonpointer.JsonPointer] = {}
+        self.composed_uri_cache: Dict[Tuple[Any, Any], str] = {}
+        self.composed_namespace_cache: Dict[Tuple[Any, ...], str] = {}
+        self.indexed_schema: List[dict] | None = None
+        self.named_type_index: Dict[Tuple[Any, Any], int] = {}
+        self.type_name_index: Dict[Any, int] = {}
+        self.indexed_count = 0
         self.utility_namespace = 'utility.vasters.com'
         self.split_top_level_records = False
         self.root_class_name = 'document'
@@ -54,19 +105,28 @@ class JsonToAvroConverter:
         Returns:
         bool: True if the Avro type is empty, False otherwise.
         """
-        if len(avro_type) == 0:
-            return True
-        if isinstance(avro_type, list):
-            return all(self.is_empty_type(t) for t in avro_type)
-        if isinstance(avro_type, dict):
-            if not 'type' in avro_type:
-                return True
-            if (avro_type['type'] == 'record' and (not 'fields' in avro_type or len(avro_type['fields']) == 0)) or \
-               (avro_type['type'] == 'enum' and (not 'symbols' in avro_type or len(avro_type['symbols']) == 0)) or \
-               (avro_type['type'] == 'array' and (not 'items' in avro_type or not avro_type['items'])) or \
-               (avro_type['type'] == 'map' and (not 'values' in avro_type or not avro_type['values'])):
-                return True
-        return False
+        # a union is empty only if all of its (possibly nested) members are empty,
+        # so members are walked depth-first in order and the first non-empty one ends the walk
+        stack = [avro_type]
+        while stack:
+            avro_type = stack.pop()
+            if len(avro_type) == 0:
+                continue
+            kind = type(avro_type)
+            if kind is list or (kind is not dict and isinstance(avro_type, list)):
+                stack.extend(reversed(avro_type))
+                continue
+            if kind is dict or isinstance(avro_type, dict):
+                type_name = avro_type.get('type')
+                if type_name is None and not 'type' in avro_type:
+                    continue
+                if (type_name == 'record' and not avro_type.get('fields')) or \
+                   (type_name == 'enum' and not avro_type.get('symbols')) or \
+                   (type_name == 'array' and not avro_type.get('items')) or \
+                   (type_name == 'map' and not avro_type.get('values')):
+                    continue
+            return False
+        return True
 
     def is_empty_json_type(self, json_type):
         """
@@ -317,6 +377,86 @@ class JsonToAvroConverter:
         return flat_list_1
 
     # pylint: disable=dangerous-default-value
+    def index_avro_schema(self, avro_schema: list) -> None:
+        """
+        Starts indexing the given Avro schema list by type name.
+
+        Args:
+            avro_schema (list): The Avro schema list that types are registered in.
+
+        """
+        self.indexed_schema = avro_schema
+        self.named_type_index = {}
+        self.type_name_index = {}
+        self.indexed_count = 0
+
+    def sync_avro_schema_index(self, avro_schema: list) -> bool:
+        """
+        Adds the types appended to the indexed Avro schema list since the last lookup to the indexes.
+
+        Args:
+            avro_schema (list): The Avro schema list to look up types in.
+
+        Returns:
+            bool: True if the list is indexed, False if lookups must scan it.
+
+        """
+        if avro_schema is not self.indexed_schema:
+            return False
+        # the schema list only grows during a conversion, so the indexes are extended rather than rebuilt
+        for i in range(self.indexed_count, len(avro_schema)):
+            avro_type = avro_schema[i]
+            self.named_type_index.setdefault((avro_type.get('namespace'), avro_type.get('name')), i)
+            self.type_name_index.setdefault(avro_type.get('name'), i)
+        self.indexed_count = len(avro_schema)
+        return True
+
+    def find_named_type(self, avro_schema: list, name: str, namespace: str | None) -> dict | None:
+        """
+        Finds the first type with the given name and namespace in the Avro schema list.
+
+        Args:
+            avro_schema (list): The Avro schema list to search.
+            name (str): The name of the type.
+            namespace (str | None): The namespace of the type.
+
+        Returns:
+            dict | None: The type, or None if the list has no such type.
+
+        """
+        if self.sync_avro_schema_index(avro_schema):
+            i = self.named_type_index.get((namespace, name))
+            if i is None:
+                return None
+            avro_type = avro_schema[i]
+            if avro_type.get('name') == name and avro_type.get('namespace') == namespace:
+                return avro_type
+            # the indexed type was modified in place, so the index can't be trusted
+            self.index_avro_schema(avro_schema)
+        return next((t for t in avro_schema if t.get('name') == name and t.get('namespace') == namespace), None)
+
+    def find_type_by_name(self, avro_schema: list, name: str) -> dict | None:
+        """
+        Finds the first type with the given name in the Avro schema list, regardless of its namespace.
+
+        Args:
+            avro_schema (list): The Avro schema list to search.
+            name (str): The name of the type.
+
+        Returns:
+            dict | None: The type, or None if the list has no such type.
+
+        """
+        if self.sync_avro_schema_index(avro_schema):
+            i = self.type_name_index.get(name)
+            if i is None:
+                return None
+            avro_type = avro_schema[i]
+            if avro_type.get('name') == name:
+                return avro_type
+            self.index_avro_schema(avro_schema)
+        return next((s for s in avro_schema if s.get('name') == name), None)
+
     def merge_avro_schemas(self, schemas: list, avro_schemas: list, type_name: str | None = None, deps: List[str] = []) -> str | list | dict:
         """Merge multiple Avro type schemas into one."""
 
@@ -349,17 +489,30 @@ class JsonToAvroConverter:
             return schemas[0]
         if type_name:
             self.set_avro_type_value(merged_schema, 'name', type_name)
+        if len(schemas) == 2 and isinstance(schemas[0], dict) and not schemas[0] and isinstance(schemas[1], dict) and schemas[1]:
+            # fast path for the common [avro_type, fragment] call where avro_type is still empty:
+            # the loop below would skip the empty schema and copy the fragment over the name
+            if 'dependencies' in schemas[1]:
+                merged_schema['dependencies'] = []
+            merged_schema.update(copy.deepcopy(schemas[1]))
+            if merged_schema.get('type') in ['array', 'map'] and 'namespace' in merged_schema:
+                del merged_schema['namespace']
+            return merged_schema
         for i, schema in enumerate(schemas):
-            schema = copy.deepcopy(schema)
+            if not isinstance(schema, str):
+                schema = copy.deepcopy(schema)
             if isinstance(schema, dict) and 'dependencies' in schema:
                 deps1: List[str] = merged_schema.get('dependencies', [])
-                deps1.extend(schema['dependencies'])
+                seen_deps = set(deps1)
+                for dep in schema['dependencies']:
+                    if dep not in seen_deps:
+                        seen_deps.add(dep)
+                        deps1.append(dep)
                 merged_schema['dependencies'] = deps1
             if (isinstance(schema, list) or isinstance(schema, dict)) and len(schema) == 0:
                 continue
             if isinstance(schema, str):
-                sch = next(
-                    (s for s in avro_schemas if s.get('name') == schema), None)
+                sch = self.find_type_by_name(avro_schemas, schema)
                 if sch:
                     merged_schema.update(sch)
                 else:
@@ -390,12 +543,17 @@ class JsonToAvroConverter:
                         merged_schema.get('name', '') + schema.get('name', '')))
                 if 'fields' in schema:
                     if 'fields' in merged_schema:
+                        # equal fields have equal names, so a field is only compared with its namesakes
+                        fields_by_name: Dict[Any, List[dict]] = {}
+                        for merged_field in merged_schema['fields']:
+                            fields_by_name.setdefault(merged_field.get('name'), []).append(merged_field)
                         for field in schema['fields']:
-                            if field not in merged_schema['fields']:
+                            namesakes = fields_by_name.setdefault(field.get('name'), [])
+                            if field not in namesakes:
                                 merged_schema['fields'].append(field)
+                                namesakes.append(field)
                             else:
-                                merged_schema_field = next(
-                                    f for f in merged_schema['fields'] if f.get('name') == field.get('name'))
+                                merged_schema_field = namesakes[0]
                                 if merged_schema_field['type'] != field['type']:
                                     merged_schema_field['type'] = [
                                         field['type'], merged_schema_field['type']]
@@ -446,13 +604,14 @@ class JsonToAvroConverter:
 
         for json_schema in json_schemas:
             if 'type' not in json_schema or 'type' not in merged_type:
-                for key in json_schema:
+                for key, value in json_schema.items():
                     if not key in merged_type:
-                        merged_type[key] = copy.deepcopy(json_schema[key])
+                        # only containers can be mutated by later merges; scalars are shared as-is
+                        merged_type[key] = copy.deepcopy(value) if isinstance(value, (dict, list)) else value
                     else:
                         if key == 'required':
                             merged_type[key] = list(
-                                set(merged_type[key]).union(set(json_schema[key])))
+                                {*merged_type[key], *json_schema[key]})
                         if key == 'name' or key == 'title' or key == 'description':
                             merged_type[key] = merged_type[key] + \
                                 json_schema[key]
@@ -477,7 +636,7 @@ class JsonToAvroConverter:
                 if 'required' in json_schema:
                     if 'required' in merged_type:
                         merged_type['required'] = list(
-                            set(merged_type['required']).union(set(json_schema['required'])))
+                            {*merged_type['required'], *json_schema['required']})
                     else:
                         merged_type['required'] = json_schema['required']
                 if 'name' in json_schema:
@@ -499,7 +658,7 @@ class JsonToAvroConverter:
                 if 'enum' in json_schema:
                     if 'enum' in merged_type:
                         merged_type['enum'] = list(
-                            set(merged_type['enum']).union(set(json_schema['enum'])))
+                            {*merged_type['enum'], *json_schema['enum']})
                     else:
                         merged_type['enum'] = json_schema['enum']
                 if 'format' in json_schema:
@@ -515,7 +674,7 @@ class JsonToAvroConverter:
                 new_required = merged_type['required']
                 for json_schema in json_schemas:
                     new_required = list(set(new_required).intersection(
-                        set(json_schema.get('required', []))))
+                        json_schema.get('required', [])))
                 merged_type['required'] = new_required
 
         return merged_type
@@ -574,32 +733,20 @@ class JsonToAvroConverter:
                     union.append(avro_primitive)
                 return union
 
-        if json_primitive == 'string':
-            avro_primitive = 'string'
-        elif json_primitive == 'integer':
-            avro_primitive = 'int'
-            if format == 'int64':
-                avro_primitive = 'long'
-        elif json_primitive == 'number':
-            avro_primitive = 'float'
-        elif json_primitive == 'boolean':
-            avro_primitive = 'boolean'
-        elif not format:
+        avro_primitive = json_primitive_types.get(json_primitive) if isinstance(json_primitive, str) else None
+        if avro_primitive == 'int' and format == 'int64':
+            avro_primitive = 'long'
+        elif avro_primitive is None and not format:
             if isinstance(json_primitive, str):
                 dependencies.append(json_primitive)
             avro_primitive = json_primitive
 
         # if you've got { 'type': 'string', 'format': ['date-time', 'duration'] }, I'm sorry
         if format and isinstance(format, str):
-            if format in ('date-time', 'date'):
-                avro_primitive = {'type': 'int', 'logicalType': 'date'}
-            elif format in ('time'):
-                avro_primitive = {'type': 'int', 'logicalType': 'time-millis'}
-            elif format in ('duration'):
-                avro_primitive = {'type': 'fixed',
-                                  'size': 12, 'logicalType': 'duration'}
-            elif format in ('uuid'):
-                avro_primitive = {'type': 'string', 'logicalType': 'uuid'}
+            logical_type = format_logical_types.get(format)
+            if logical_type:
+                # callers may name or namespace the returned type, so each call gets its own copy
+                avro_primitive = dict(logical_type)
 
         return avro_primitive
 
@@ -620,35 +767,35 @@ class JsonToAvroConverter:
         """
         # Parse the URL to determine the scheme
         if isinstance(url, str):
-            parsed_url = urlparse(url)
+            parsed_url = self.parse_uri(url)
         else:
             parsed_url = url
 
-        if parsed_url.geturl() in self.content_cache:
-            return self.content_cache[parsed_url.geturl()]
+        cache_key = parsed_url.geturl()
+        if cache_key in self.content_cache:
+            return self.content_cache[cache_key]
         scheme = parsed_url.scheme
 
         # Handle HTTP and HTTPS URLs
         if scheme in ['http', 'https']:
-            response = requests.get(url if isinstance(
+            if self.http_session is None:
+                # remote $ref trees usually point at a few hosts, so keep their connections alive
+                self.http_session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16)
+                self.http_session.mount('http://', adapter)
+                self.http_session.mount('https://', adapter)
+            response = self.http_session.get(url if isinstance(
                 url, str) else parsed_url.geturl(), timeout=30)
             # Raises an HTTPError if the response status code is 4XX/5XX
             response.raise_for_status()
-            self.content_cache[parsed_url.geturl()] = response.text
+            self.content_cache[cache_key] = response.text
             return response.text
 
         # Handle file URLs
         elif scheme == 'file':
-            # Remove the leading 'file://' from the path for compatibility
-            file_path = parsed_url.netloc
-            if not file_path:
-                file_path = parsed_url.path
-            # On Windows, a file URL might start with a '/' but it's not part of the actual path
-            if os.name == 'nt' and file_path.startswith('/'):
-                file_path = file_path[1:]
-            with open(file_path, 'r', encoding='utf-8') as file:
+            with open(file_url_to_path(parsed_url), 'r', encoding='utf-8') as file:
                 text = file.read()
-                self.content_cache[parsed_url.geturl()] = text
+                self.content_cache[cache_key] = text
                 return text
         else:
             raise NotImplementedError(f'Unsupported URL scheme: {scheme}')
@@ -673,7 +820,7 @@ class JsonToAvroConverter:
         try:
             ref = json_type['$ref']
             content = None
-            url = urlparse(ref)
+            url = self.parse_uri(ref)
             if url.scheme:
                 content = self.fetch_content(ref)
             elif url.path:
@@ -681,19 +828,18 @@ class JsonToAvroConverter:
                 content = self.fetch_content(file_uri)
             if content:
                 try:
-                    json_schema_doc = json_schema = json.loads(content)
+                    json_schema_doc = json_schema = load_json_document(content)
                     # resolve the JSON Pointer reference, if any
                     if url.fragment:
-                        json_schema = jsonpointer.resolve_pointer(
-                            json_schema, url.fragment)
+                        json_schema = self.compile_json_pointer(
+                            url.fragment).resolve(json_schema)
                     return json_schema, json_schema_doc
                 except json.JSONDecodeError:
                     raise Exception(f'Error decoding JSON from {ref}')
 
             if url.fragment:
-                json_pointer = unquote(url.fragment)
-                ref_schema = jsonpointer.resolve_pointer(
-                    json_doc, json_pointer)
+                ref_schema = self.compile_json_pointer(
+                    unquote(url.fragment)).resolve(json_doc)
                 if ref_schema:
                     return ref_schema, json_doc
         except JsonPointerException as e:
@@ -701,15 +847,52 @@ class JsonToAvroConverter:
                 f'Error resolving JSON Pointer reference for {base_uri}')
         return json_type, json_doc
 
+    def parse_uri(self, uri: str) -> ParseResult:
+        """
+        Parses a URI, caching the result since the same $ref is parsed on every visit.
+
+        Args:
+            uri (str): The URI to parse.
+
+        Returns:
+            ParseResult: The parsed URI.
+
+        """
+        parsed = self.parsed_uri_cache.get(uri)
+        if parsed is None:
+            parsed = self.parsed_uri_cache[uri] = urlparse(uri)
+        return parsed
+
+    def compile_json_pointer(self, pointer: str) -> jsonpointer.JsonPointer:
+        """
+        Compiles a JSON pointer, caching the result since the same fragment is resolved on every visit.
+
+        Args:
+            pointer (str): The JSON pointer string.
+
+        Returns:
+            jsonpointer.JsonPointer: The compiled pointer.
+
+        """
+        compiled = self.json_pointer_cache.get(pointer)
+        if compiled is None:
+            compiled = self.json_pointer_cache[pointer] = jsonpointer.JsonPointer(pointer)
+        return compiled
+
     def compose_uri(self, base_uri, url):
+        key = (base_uri, url)
+        if key in self.composed_uri_cache:
+            return self.composed_uri_cache[key]
         if isinstance(url, str):
-            url = urlparse(url)
+            url = self.parse_uri(url)
             if url.scheme:
-                return url.geturl()
+                self.composed_uri_cache[key] = url.geturl()
+                return self.composed_uri_cache[key]
         if not url.path and not url.netloc:
+            self.composed_uri_cache[key] = base_uri
             return base_uri
         if base_uri.startswith('file'):
-            parsed_file_uri = urlparse(base_uri)
+            parsed_file_uri = self.parse_uri(base_uri)
             dir = os.path.dirname(
                 parsed_file_uri.netloc if parsed_file_uri.netloc else parsed_file_uri.path)
             filename = os.path.join(dir, url.path)
@@ -717,6 +900,7 @@ class JsonToAvroConverter:
         else:
             # combine the base URI with the URL
             file_uri = urllib.parse.urljoin(base_uri, url.geturl())
+        self.composed_uri_cache[key] = file_uri
         return file_uri
 
     def get_field_type_name(self, field: dict) -> str:
@@ -747,9 +931,10 @@ class JsonToAvroConverter:
 
             avro_type: list | dict | str = {}
             local_name = avro_name(field_name if field_name else record_name)
-            hasAnyOf = isinstance(json_type, dict) and 'anyOf' in json_type
+            is_json_object = isinstance(json_type, dict)
+            hasAnyOf = is_json_object and 'anyOf' in json_type
 
-            if isinstance(json_type, dict):
+            if is_json_object:
 
                 json_object_type = json_type.get('type')
                 # Check if the type is already an Avro schema (e.g., shared discriminator enum)
@@ -798,7 +983,7 @@ class JsonToAvroConverter:
                             del json_type['type']
                             json_type['oneOf'] = oneof
 
-                if 'if' in json_type or 'then' in json_type or 'else' in json_type or 'dependentSchemas' in json_type or 'dependentRequired' in json_type:
+                if not conditional_keywords.isdisjoint(json_type):
                     # Try to handle the conditional schema pattern
                     conditional_handled = False
                     if 'if' in json_type:
@@ -818,27 +1003,17 @@ class JsonToAvroConverter:
                             print(
                                 f'WARNING: Conditional schema pattern ({", ".join(remaining_conditionals)}) is not fully supported and will be simplified.')
                         
-                        if 'if' in json_type:
-                            del json_type['if']
-                        if 'then' in json_type:
-                            del json_type['then']
-                        if 'else' in json_type:
-                            del json_type['else']
-                        if 'dependentSchemas' in json_type:
-                            del json_type['dependentSchemas']
-                        if 'dependentRequired' in json_type:
-                            del json_type['dependentRequired']
-
-                base_type = json_type.copy()
-                if 'oneOf' in base_type:
-                    del base_type['oneOf']
-                if 'anyOf' in base_type:
-                    del base_type['anyOf']
-                if 'allOf' in base_type:
-                    del base_type['allOf']
+                        # strip the conditionals from a copy so that the caller's schema stays intact
+                        json_type = {key: value for key, value in json_type.items() if key not in conditional_keywords}
+
+                compositions = json_type.keys() & composition_keywords
+                if compositions:
+                    base_type = {key: value for key, value in json_type.items() if key not in composition_keywords}
+                else:
+                    base_type = json_type.copy()
                 json_types = []
 
-                if 'allOf' in json_type:
+                if 'allOf' in compositions:
                     # Check if this is a discriminated union pattern
                     discriminated_union_types = self.detect_discriminated_union(json_type)
                     
@@ -922,7 +1097,8 @@ class JsonToAvroConverter:
                                 json_types.append(variant_type)
                     else:
                         # Original allOf merging logic for non-discriminated unions
-                        type_list = [copy.deepcopy(base_type)]
+                        # merge_json_schemas copies all values of the first schema, so base_type is not copied here
+                        type_list = [base_type]
                         for allof_option in json_type['allOf']:
                             while isinstance(allof_option, dict) and '$ref' in allof_option:
                                 resolved_json_type, resolved_schema = self.resolve_reference(
@@ -935,37 +1111,28 @@ class JsonToAvroConverter:
                             type_list, intersect=False)
                         json_types.append(merged_type)
 
-                if 'oneOf' in json_type:
+                if 'oneOf' in compositions:
                     # if the json type is a oneOf, we create a type union of all types
+                    # type_to_process is only read and merged as the first schema, which merge_json_schemas copies
                     if len(json_types) == 0:
-                        type_to_process = copy.deepcopy(base_type)
+                        type_to_process = base_type
                     else:
-                        type_to_process = copy.deepcopy(json_types.pop())
+                        type_to_process = json_types.pop()
                     json_types = []
-                    oneof = json_type['oneOf']
-                    if len(json_types) == 0:
-                        for oneof_option in oneof:
-                            if isinstance(oneof_option, dict) and 'type' in oneof_option and 'type' in type_to_process and not type_to_process.get('type') == oneof_option.get('type'):
-                                # we can't merge these due to conflicting types, so we pass the option-type on as-is
-                                json_types.append(oneof_option)
-                            else:
-                                json_types.append(self.merge_json_schemas(
-                                    [type_to_process, oneof_option], intersect=True))
-                    else:
-                        new_json_types = []
-                        for oneof_option in oneof:
-                            for json_type_option in json_types:
-                                json_type_option = self.merge_json_schemas(
-                                    [json_type_option, oneof_option], intersect=True)
-                                new_json_types.append(json_type_option)
-                        json_types = new_json_types
-
-                if 'anyOf' in json_type:
-                    types_to_process = json_types.copy() if len(json_types) > 0 else [
-                        copy.deepcopy(base_type)]
+                    has_type = 'type' in type_to_process
+                    for oneof_option in json_type['oneOf']:
+                        if has_type and isinstance(oneof_option, dict) and 'type' in oneof_option and not type_to_process.get('type') == oneof_option.get('type'):
+                            # we can't merge these due to conflicting types, so we pass the option-type on as-is
+                            json_types.append(oneof_option)
+                        else:
+                            json_types.append(self.merge_json_schemas(
+                                [type_to_process, oneof_option], intersect=True))
+
+                if 'anyOf' in compositions:
+                    types_to_process = json_types.copy() if len(json_types) > 0 else [base_type]
                     json_types = []
                     for type_to_process in types_to_process:
-                        type_list = [copy.deepcopy(type_to_process)]
+                        type_list = [type_to_process]
                         # anyOf is a list of types where any number from 1 to all
                         # may match the data. Trouble with anyOf is that it doesn't
                         # really have a semantic interpretation in the context of Avro.
@@ -1020,8 +1187,8 @@ class JsonToAvroConverter:
                                 if isinstance(avro_subtype, dict) and 'name' in avro_subtype and 'type' in avro_subtype and (avro_subtype['type'] == 'record' or avro_subtype['type'] == 'enum'):
                                     # we have a standalone record or enum so we need to add it to the schema at the top-level
                                     # and reference it as a dependency from the parent type if it's not already been added.
-                                    existing_type = next((t for t in avro_schema if t.get('name') == avro_subtype['name'] and t.get(
-                                        'namespace') == avro_subtype.get('namespace')), None)
+                                    existing_type = self.find_named_type(
+                                        avro_schema, avro_subtype['name'], avro_subtype.get('namespace'))
                                     if not existing_type:
                                         if subtype_deps:
                                             if not 'dependencies' in avro_subtype:
@@ -1088,10 +1255,11 @@ class JsonToAvroConverter:
                 if 'properties' in json_type and not 'type' in json_type:
                     json_type['type'] = 'object'
 
-                if 'description' in json_type and isinstance(avro_type, dict):
+                avro_type_is_dict = isinstance(avro_type, dict)
+                if 'description' in json_type and avro_type_is_dict:
                     avro_type['doc'] = json_type['description']
 
-                if 'title' in json_type and isinstance(avro_type, dict):
+                if 'title' in json_type and avro_type_is_dict:
                     self.set_avro_type_value(
                         avro_type, 'name', avro_name(json_type['title']))
 
@@ -1112,10 +1280,12 @@ class JsonToAvroConverter:
                     ref = json_type['$ref']
                     if ref in self.imported_types:
                         # reference was already resolved, so we can resolve the reference simply by returning the type
-                        type_ref = copy.deepcopy(self.imported_types[ref])
+                        type_ref = self.imported_types[ref]
                         if isinstance(type_ref, str):
+                            # the common case of a named type reference needs no copy
                             dependencies.append(type_ref)
-                        return self.post_check_avro_type(dependencies, type_ref)
+                            return type_ref
+                        return self.post_check_avro_type(dependencies, copy.deepcopy(type_ref))
                     else:
                         new_base_uri = self.compose_uri(
                             base_uri, json_type['$ref'])
@@ -1126,7 +1296,7 @@ class JsonToAvroConverter:
                             # and reference it like it was in the same file
                             type_name = record_name
                             type_namespace = namespace
-                            parsed_ref = urlparse(ref)
+                            parsed_ref = self.parse_uri(ref)
                             if parsed_ref.fragment:
                                 type_name = avro_name(
                                     parsed_ref.fragment.split('/')[-1])
@@ -1183,8 +1353,9 @@ class JsonToAvroConverter:
                                         return self.post_check_avro_type(dependencies, avro_type)
                             else:
                                 avro_type = resolved_avro_type
-                                self.imported_types[ref] = copy.deepcopy(
-                                    avro_type)
+                                # a record or enum is standalone, so this entry is replaced by its
+                                # qualified name below and can share the type instead of copying it
+                                self.imported_types[ref] = avro_type
 
                             if len(deps) > 0:
                                 if isinstance(avro_type, dict):
@@ -1236,13 +1407,16 @@ class JsonToAvroConverter:
 
                 # if 'const' is present, make this an enum
                 if 'const' in json_type:
-                    const_list = json_type['const'] if isinstance(
-                        json_type['const'], list) else [json_type['const']]
+                    const_value = json_type['const']
+                    const_list = const_value if isinstance(
+                        const_value, list) else [const_value]
                     avro_type = self.merge_avro_schemas([avro_type, self.create_enum_type(
                         local_name, namespace, const_list)], avro_schema, local_name)
-                if json_object_type or 'enum' in json_type:
+                # json_type may have been replaced above, so its keys are read here and reused below
+                has_enum = 'enum' in json_type
+                if json_object_type or has_enum:
                     if json_object_type == 'array':
-                        if isinstance(json_type, dict) and 'items' in json_type:
+                        if 'items' in json_type:
                             deps = []
                             item_type = self.json_type_to_avro_type(
                                 json_type['items'], record_name, field_name, namespace, deps, json_schema, base_uri, avro_schema, record_stack, recursion_depth + 1)
@@ -1277,14 +1451,13 @@ class JsonToAvroConverter:
                             'name', local_name) if isinstance(avro_type, dict) else local_name)
                         self.lift_dependencies_from_type(
                             avro_type, dependencies)
-                    elif 'enum' in json_type:
+                    elif has_enum:
                         # Handle enums with proper type handling for mixed string/int enums
                         enum_values = json_type['enum']
                         schema_type = json_type.get('type', 'string')
                         
                         # For pure string enums with valid symbols, use simple enum without suffix
-                        string_values = [v for v in enum_values if isinstance(v, str) and v]
-                        int_values = [v for v in enum_values if isinstance(v, int)]
+                        string_values, int_values = self.split_enum_values(enum_values)
                         
                         if not int_values and string_values:
                             # Pure string enum
@@ -1316,21 +1489,19 @@ class JsonToAvroConverter:
                             # Register any embedded enum types in the union
                             self.register_embedded_types_in_union(avro_type, avro_schema, dependencies)
                     else:
+                        # enums were handled above, so there is none to pass on here
                         avro_type = self.json_schema_primitive_to_avro_type(json_object_type, json_type.get(
-                            'format'), json_type.get('enum'), record_name, field_name, namespace, dependencies)
+                            'format'), None, record_name, field_name, namespace, dependencies)
             else:
-                if isinstance(json_type, dict):
-                    avro_type = self.merge_avro_schemas([avro_type, self.json_schema_primitive_to_avro_type(json_type, json_type.get('format'), json_type.get(
-                        'enum'), record_name, field_name, namespace, dependencies)], avro_schema, avro_type.get('name', local_name) if isinstance(avro_type, dict) else local_name)
-                else:
-                    avro_type = self.merge_avro_schemas([avro_type, self.json_schema_primitive_to_avro_type(
-                        json_type, None, None, record_name, field_name, namespace, dependencies)], avro_schema, avro_type.get('name', local_name) if isinstance(avro_type, dict) else local_name)
+                # json_type is a primitive type name or list of names and avro_type is still empty here
+                avro_type = self.merge_avro_schemas([avro_type, self.json_schema_primitive_to_avro_type(
+                    json_type, None, None, record_name, field_name, namespace, dependencies)], avro_schema, local_name)
 
             if isinstance(avro_type, dict) and 'name' in avro_type and 'type' in avro_type and not (avro_type['type'] in ['array', 'map']):
                 if not 'namespace' in avro_type:
                     avro_type['namespace'] = namespace
-                existing_type = next((t for t in avro_schema if t.get(
-                    'name') == avro_type['name'] and t.get('namespace') == avro_type.get('namespace')), None)
+                existing_type = self.find_named_type(
+                    avro_schema, avro_type['name'], avro_type.get('namespace'))
                 if existing_type:
                     existing_type_name = self.get_qualified_name(existing_type)
                     if not existing_type_name in dependencies:
@@ -1362,8 +1533,8 @@ class JsonToAvroConverter:
 
     def register_type(self, avro_schema, avro_type) -> bool:
         """Register a type in the Avro schema."""
-        existing_type = next((t for t in avro_schema if t.get(
-            'name') == avro_type['name'] and t.get('namespace') == avro_type.get('namespace')), None)
+        existing_type = self.find_named_type(
+            avro_schema, avro_type['name'], avro_type.get('namespace'))
         if not existing_type:
             if self.is_empty_type(avro_type) and not 'unmerged_types' in avro_type:
                 print(f'WARN: Standalone type {avro_type["name"]} is empty')
@@ -1394,7 +1565,7 @@ class JsonToAvroConverter:
 
     def has_composition_keywords(self, json_object: dict) -> bool:
         """Check if the JSON object has any of the combining keywords: allOf, oneOf, anyOf."""
-        return isinstance(json_object, dict) and ('allOf' in json_object or 'oneOf' in json_object or 'anyOf' in json_object)
+        return isinstance(json_object, dict) and not composition_keywords.isdisjoint(json_object)
 
     def has_enum_keyword(self, json_object: dict) -> bool:
         """Check if the JSON object is an enum."""
@@ -1450,9 +1621,30 @@ class JsonToAvroConverter:
             'type': 'enum',
             'name': name,
             'namespace': namespace,
-            'symbols': [avro_name(s) for s in symbols]
+            # distinct values like 'node.js' and 'node_js' normalize to the same symbol
+            'symbols': list(dict.fromkeys(avro_name(s) for s in symbols))
         }
 
+    def split_enum_values(self, enum_values: list) -> Tuple[list, list]:
+        """
+        Split JSON Schema enum values into non-empty string values and int values in one pass.
+
+        Args:
+            enum_values (list): The list of enum values from JSON Schema.
+
+        Returns:
+            Tuple[list, list]: The string values and the int values.
+        """
+        string_values = []
+        int_values = []
+        for v in enum_values:
+            if isinstance(v, str):
+                if v:
+                    string_values.append(v)
+            elif isinstance(v, int):
+                int_values.append(v)
+        return string_values, int_values
+
     def enum_symbols_need_string_fallback(self, symbols: list) -> bool:
         """
         Check if any enum symbols will be transformed by avro_name().
@@ -1493,8 +1685,7 @@ class JsonToAvroConverter:
         has_null = 'null' in json_types
         
         # Separate string and int enum values
-        string_values = [v for v in enum_values if isinstance(v, str) and v]
-        int_values = [v for v in enum_values if isinstance(v, int)]
+        string_values, int_values = self.split_enum_values(enum_values)
         
         # Pure integer enum case
         if has_int and not has_string and not string_values:
@@ -1507,7 +1698,8 @@ class JsonToAvroConverter:
         
         # Build the enum from string values (or string representations of all values)
         if string_values:
-            enum_symbols = list(set(string_values))
+            # dedup in one pass, keeping the order of the JSON schema
+            enum_symbols = list(dict.fromkeys(string_values))
         else:
             # No string values but has_string type - shouldn't happen normally
             enum_symbols = []
@@ -1563,6 +1755,14 @@ class JsonToAvroConverter:
             'values': values
         }
 
+    def is_nullable_type(self, avro_type: list | dict | str) -> bool:
+        """Check if the Avro type is null or a union that includes null."""
+        if isinstance(avro_type, str):
+            return avro_type == 'null'
+        if isinstance(avro_type, list):
+            return 'null' in avro_type
+        return False
+
     def nullable(self, avro_type: list | dict | str) -> list | dict | str:
         """Wrap a type in a union with null."""
         if isinstance(avro_type, list):
@@ -1595,7 +1795,12 @@ class JsonToAvroConverter:
 
     def compose_namespace(self, *names) -> str:
         """Compose a namespace from a list of names."""
-        return '.'.join([avro_namespace(n) for n in names if n])
+        composed = self.composed_namespace_cache.get(names)
+        if composed is None:
+            # composed namespaces and qualified names repeat across every nested type and dependency list
+            composed = sys.intern('.'.join([avro_namespace(n) for n in names if n]))
+            self.composed_namespace_cache[names] = composed
+        return composed
 
     def get_qualified_name(self, avro_type):
         """Get the qualified name of an Avro type."""
@@ -1684,9 +1889,14 @@ class JsonToAvroConverter:
             record_stack.append(record_name)
             # collect the required fields so we can make those fields non-null
             required_fields = json_object.get('required', [])
+            if isinstance(required_fields, list):
+                # field names are strings, so only string entries can ever match
+                required_fields = {r for r in required_fields if isinstance(r, str)}
 
             field_refs = []
             if 'properties' in json_object and isinstance(json_object['properties'], dict):
+                append_field = avro_record['fields'].append
+                append_field_ref = field_refs.append
                 # add the properties as fields
                 for field_name, json_field_types in json_object['properties'].items():
                     if isinstance(json_field_types, bool):
@@ -1743,11 +1953,13 @@ class JsonToAvroConverter:
                         field_type_list) == 1 else field_type_list
                     effective_field_ref_type = field_ref_type_list[0] if len(
                         field_ref_type_list) == 1 else field_ref_type_list
+                    is_optional = not field_name in required_fields
+                    avro_field_name = avro_name(field_name)
                     avro_field = {
-                        'name': avro_name(field_name),
-                        'type': self.nullable(effective_field_type) if not field_name in required_fields and 'null' not in effective_field_type else effective_field_type
+                        'name': avro_field_name,
+                        'type': self.nullable(effective_field_type) if is_optional and not self.is_nullable_type(effective_field_type) else effective_field_type
                     }
-                    if field_name != avro_name(field_name):
+                    if field_name != avro_field_name:
                         avro_field['altnames'] = { "json": field_name }
                     if const:
                         avro_field['const'] = const
@@ -1757,24 +1969,22 @@ class JsonToAvroConverter:
                         avro_field['doc'] = description
                     if discriminator:
                         avro_field['discriminator'] = discriminator
-                    field_type_list.append(avro_field_type)
                     avro_field_ref = {
-                        'name': avro_name(field_name),
-                        'type': self.nullable(effective_field_ref_type) if not field_name in required_fields and 'null' not in effective_field_ref_type else effective_field_ref_type
+                        'name': avro_field_name,
+                        'type': self.nullable(effective_field_ref_type) if is_optional and not self.is_nullable_type(effective_field_ref_type) else effective_field_ref_type
                     }
                     if description:
                         avro_field_ref['doc'] = description
-                    field_ref_type_list.append(avro_field_ref)
                     # add the field to the record
-                    avro_record['fields'].append(avro_field)
-                    field_refs.append(avro_field_ref)
+                    append_field(avro_field)
+                    append_field_ref(avro_field_ref)
             elif not 'additionalProperties' in json_object and not 'patternProperties' in json_object:
                 if 'type' in json_object and (json_object['type'] == 'object' or 'object' in json_object['type']) and \
-                        not 'allOf' in json_object and not 'oneOf' in json_object and not 'anyOf' in json_object:
+                        composition_keywords.isdisjoint(json_object):
                     # we don't have any fields, but we have an object type, so we create a map
                     avro_record = self.create_map_type(generic_type())
                 elif 'type' in json_object and (json_object['type'] == 'array' or 'array' in json_object['type']) and \
-                        not 'allOf' in json_object and not 'oneOf' in json_object and not 'anyOf' in json_object:
+                        composition_keywords.isdisjoint(json_object):
                     # we don't have any fields, but we have an array type, so we create a record with an 'items' field
                     avro_record = self.create_array_type(
                         self.json_type_to_avro_type(
@@ -1860,8 +2070,8 @@ class JsonToAvroConverter:
                 avro_record['doc'] = doc if not 'doc' in avro_record else avro_record['doc'] + ', ' + doc
 
             if len(dependencies) > 0:
-                # dedupe the list
-                dependencies = list(set(dependencies))
+                # dedupe the list, keeping the order in which the dependencies were found
+                dependencies = list(dict.fromkeys(dependencies))
                 avro_record['dependencies'] = dependencies
         finally:
             record_stack.pop()
@@ -1877,18 +2087,20 @@ class JsonToAvroConverter:
     def postprocess_schema(self, avro_schema: list) -> None:
         """ Post-process the Avro Schema for cases wheer we need a second pass """
         if len(self.types_with_unmerged_types) > 0:
-            types_with_unmerged_types = copy.deepcopy(
-                self.types_with_unmerged_types)
+            # only the names are needed to find the types again, so those are snapshotted
+            # instead of deep-copying the types, which are rewritten in place below
+            types_with_unmerged_types = [(ref_type['name'], ref_type['namespace'])
+                                         for ref_type in self.types_with_unmerged_types]
             self.types_with_unmerged_types = []
-            for ref_type in types_with_unmerged_types:
+            for ref_name, ref_namespace in types_with_unmerged_types:
                 # find ref_type anywhere in the avro_schema graph, matching
                 # on name and namespace.
                 def find_fn(
-                    t): return 'name' in t and t['name'] == ref_type['name'] and 'namespace' in t and t['namespace'] == ref_type['namespace']
+                    t): return 'name' in t and t['name'] == ref_name and 'namespace' in t and t['namespace'] == ref_namespace
                 type = find_schema_node(find_fn, avro_schema)
                 if not type:
                     raise ValueError(
-                        f"Couldn't find type {ref_type['namespace']}.{ref_type['name']} in the Avro Schema.")
+                        f"Couldn't find type {ref_namespace}.{ref_name} in the Avro Schema.")
                 # resolve the unmerged types
                 local_name = type.get('name')
                 if not isinstance(type, dict):
@@ -1940,7 +2152,7 @@ class JsonToAvroConverter:
             if not isinstance(schema, dict) and not isinstance(schema, list):
                 # skip items that are not schema definitions or lists
                 continue
-            if 'type' in schema or 'allOf' in schema or 'oneOf' in schema or 'anyOf' in schema or 'properties' in schema or 'enum' in schema or '$ref' in schema or 'additionalProperties' in schema or 'patternProperties' in schema:
+            if isinstance(schema, dict) and not definition_keywords.isdisjoint(schema):
                 # this is a schema definition
                 self.process_definition(
                     json_schema, namespace, base_uri, avro_schema, record_stack, sub_schema_name, schema)
@@ -1976,8 +2188,8 @@ class JsonToAvroConverter:
                 continue
             if isinstance(avro_schema_item, dict) and not 'name' in avro_schema_item:
                 avro_schema_item['name'] = avro_name(schema_name)
-            existing_type = next((t for t in avro_schema if t.get('name') == avro_schema_item['name'] and t.get(
-                'namespace') == avro_schema_item.get('namespace')), None)
+            existing_type = self.find_named_type(
+                avro_schema, avro_schema_item['name'], avro_schema_item.get('namespace'))
             if not existing_type:
                 if (not self.is_empty_type(avro_schema_item) or 'unmerged_types' in avro_schema_item) and \
                         self.is_standalone_avro_type(avro_schema_item):
@@ -2015,6 +2227,7 @@ class JsonToAvroConverter:
         """Convert a JSON-schema to an Avro-schema."""
         avro_schema: List[dict] = []
         record_stack: List[str] = []
+        self.index_avro_schema(avro_schema)
 
         parsed_url = urlparse(base_uri)
         schema_name = self.root_class_name
@@ -2024,7 +2237,7 @@ class JsonToAvroConverter:
             json_schema_defs = json_schema.get(
                 'definitions', json_schema.get('$defs', []))
             for def_schema_name, schema in json_schema_defs.items():
-                if 'type' in schema or 'allOf' in schema or 'oneOf' in schema or 'anyOf' in schema or 'properties' in schema or 'enum' in schema or '$ref' in schema or 'additionalProperties' in schema or 'patternProperties' in schema:
+                if isinstance(schema, dict) and not definition_keywords.isdisjoint(schema):
                     # this is a schema definition
                     self.process_definition(
                         json_schema, namespace, base_uri, avro_schema, record_stack, def_schema_name, schema)
@@ -2059,13 +2272,12 @@ class JsonToAvroConverter:
 
         if isinstance(avro_schema, list) and len(avro_schema) > 1 and self.split_top_level_records:
             new_avro_schema = []
-            for item in avro_schema:
+            for i, item in enumerate(avro_schema):
                 if isinstance(item, dict) and 'type' in item and item['type'] == 'record':
                     # we need to make a copy since the inlining operation shuffles types
                     schema_copy = copy.deepcopy(avro_schema)
-                    # find the item with the same name and namespace in the copy
-                    found_item = next((t for t in schema_copy if t.get(
-                        'name') == item['name'] and t.get('namespace') == item.get('namespace')), None)
+                    # the copy keeps the list order, so the item sits at the same position
+                    found_item = schema_copy[i]
                     if found_item:
                         # inline all dependencies of the item
                         inline_dependencies_of(schema_copy, found_item)
@@ -2107,7 +2319,7 @@ class JsonToAvroConverter:
             json_schema_file_path = 'file://' + json_schema_file_path
             parsed_url = urlparse(json_schema_file_path)
         content = self.fetch_content(parsed_url.geturl())
-        json_schema = json.loads(content)
+        json_schema = load_json_document(content)
 
         if not namespace:
             namespace = parsed_url.geturl().replace('\\', '/').replace('-',
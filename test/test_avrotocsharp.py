@@ -1,6 +1,8 @@
 from distutils.dir_util import copy_tree
 from unittest.mock import patch
 import unittest
+import glob
+import json
 import os
 import shutil
 import subprocess
@@ -10,7 +12,7 @@ from os import path, getcwd
 
 import pytest
 
-from avrotize.avrotocsharp import convert_avro_to_csharp
+from avrotize.avrotocsharp import convert_avro_schema_to_csharp, convert_avro_to_csharp
 from avrotize.jsonstoavro import convert_jsons_to_avro
 
 current_script_path = os.path.abspath(__file__)
@@ -341,7 +343,6 @@ class TestAvroToCSharp(unittest.TestCase):
         convert_avro_to_csharp(avro_path, cs_path, cbor_annotation=True)
         
         # Verify CborProperty attributes are present in generated files
-        import glob
         cs_files = glob.glob(os.path.join(cs_path, "src", "**", "*.cs"), recursive=True)
         assert len(cs_files) > 0, "No C# files were generated"
         
@@ -361,3 +362,57 @@ class TestAvroToCSharp(unittest.TestCase):
         # Verify the code compiles and tests pass
         assert subprocess.check_call(
             ['dotnet', 'test'], cwd=cs_path, stdout=sys.stdout, stderr=sys.stderr, timeout=self.DOTNET_TIMEOUT) == 0
+
+    def test_convert_avsc_with_bom_and_big_integer_to_csharp(self):
+        """ Test that schema files json accepts still convert when orjson is installed """
+        cwd = os.getcwd()
+        with open(os.path.join(cwd, "test", "avsc", "address.avsc"), 'r', encoding='utf-8') as f:
+            schema_text = f.read()
+        schema_dir = os.path.join(tempfile.gettempdir(), "avrotize", "address-bom-avsc")
+        os.makedirs(schema_dir, exist_ok=True)
+        avro_path = os.path.join(schema_dir, "address.avsc")
+        # a UTF-8 BOM and an integer beyond 64 bits, both of which orjson rejects
+        with open(avro_path, 'w', encoding='utf-8-sig') as f:
+            f.write(schema_text.replace('{', '{"x-big": 123456789012345678901234567890, ', 1))
+        cs_path = os.path.join(tempfile.gettempdir(), "avrotize", "address-bom-cs")
+        if os.path.exists(cs_path):
+            shutil.rmtree(cs_path, ignore_errors=True)
+        os.makedirs(cs_path, exist_ok=True)
+
+        convert_avro_to_csharp(avro_path, cs_path)
+
+        cs_files = glob.glob(os.path.join(cs_path, "src", "**", "*.cs"), recursive=True)
+        assert len(cs_files) > 0, "No C# files were generated"
+
+    def test_convert_avro_schema_to_csharp_regenerates_modified_output(self):
+        """ Test that rerunning an unchanged in-memory conversion with skip_unchanged restores generated files that were edited """
+        cwd = os.getcwd()
+        with open(os.path.join(cwd, "test", "avsc", "address.avsc"), 'r', encoding='utf-8') as f:
+            avro_schema = json.load(f)
+        cs_path = os.path.join(tempfile.gettempdir(), "avrotize", "address-rerun-cs")
+        if os.path.exists(cs_path):
+            shutil.rmtree(cs_path, ignore_errors=True)
+        os.makedirs(cs_path, exist_ok=True)
+
+        convert_avro_schema_to_csharp(avro_schema, cs_path, base_namespace='Rerun')
+        assert not os.path.exists(os.path.join(cs_path, ".avrotize_cache.json")), "Manifest written without skip_unchanged"
+        convert_avro_schema_to_csharp(avro_schema, cs_path, base_namespace='Rerun', skip_unchanged=True)
+        cs_files = glob.glob(os.path.join(cs_path, "src", "**", "*.cs"), recursive=True)
+        assert len(cs_files) > 0, "No C# files were generated"
+        with open(cs_files[0], 'r', encoding='utf-8') as f:
+            generated = f.read()
+        with open(cs_files[0], 'w', encoding='utf-8') as f:
+            f.write("// damaged")
+
+        convert_avro_schema_to_csharp(avro_schema, cs_path, base_namespace='Rerun', skip_unchanged=True)
+        with open(cs_files[0], 'r', encoding='utf-8') as f:
+            assert f.read() == generated, "Edited C# file was not regenerated"
+
+    def test_convert_avro_schema_to_csharp_takes_str_as_schema(self):
+        """ Test that a str passed as an in-memory schema is converted as a schema and not opened as a file """
+        cs_path = os.path.join(tempfile.gettempdir(), "avrotize", "str-schema-cs")
+        with patch('avrotize.avrotocsharp.AvroToCSharp.convert') as convert, \
+                patch('avrotize.avrotocsharp.AvroToCSharp.convert_schema') as convert_schema:
+            convert_avro_schema_to_csharp("string", cs_path, base_namespace='Primitive')
+        convert.assert_not_called()
+        convert_schema.assert_called_once_with("string", cs_path)
@@ -3,7 +3,7 @@ import os
 import sys
 import tempfile
 from os import path, getcwd
-from fastavro.schema import load_schema
+from fastavro.schema import load_schema, parse_schema
 from jsoncomparison import NO_DIFF, Compare
 import pytest
 from avrotize.jsonstoavro import convert_jsons_to_avro
@@ -130,6 +130,16 @@ class TestJsonsToAvro(unittest.TestCase):
 
     def test_convert_travis_jsons_to_avro(self):
         self.create_avro_from_jsons("travis.json", "travis.avsc")
+
+    def test_convert_travis_jsons_to_avro_split(self):
+        """Test that every record file emitted in split mode is a self-contained schema."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            convert_jsons_to_avro(path.join(getcwd(), "test", "jsons", "travis.json"), temp_dir, "com.test.example", split_top_level_records=True)
+            schema_files = sorted(os.listdir(temp_dir))
+            self.assertIn("document.avsc", schema_files)
+            for schema_file in schema_files:
+                with open(os.path.join(temp_dir, schema_file), 'r', encoding='utf-8') as f:
+                    parse_schema(json.load(f))
     
     def test_convert_discriminated_union_simple_to_avro(self):
         self.create_avro_from_jsons("discriminated-union-simple.json", "discriminated-union-simple.avsc")
@@ -149,3 +159,52 @@ class TestJsonsToAvro(unittest.TestCase):
     def test_convert_conditional_schema_patterns_to_avro(self):
         """Test if/then/else conditional schema patterns conversion."""
         self.create_avro_from_jsons("conditional-schema-patterns.json", "conditional-schema-patterns.avsc")
+
+    def test_composition_does_not_mutate_input_schema(self):
+        """Test that allOf/anyOf merging leaves the input JSON schema untouched."""
+        from avrotize.jsonstoavro import JsonToAvroConverter
+        json_type = {
+            "type": "object",
+            "properties": {"id": {"type": "string"}},
+            "allOf": [
+                {"properties": {"name": {"type": "string"}}, "required": ["name"]},
+                {"properties": {"size": {"type": "integer"}}}
+            ],
+            "anyOf": [
+                {"properties": {"color": {"type": "string"}}},
+                {"properties": {"shape": {"type": "string"}}}
+            ]
+        }
+        original = json.loads(json.dumps(json_type))
+        converter = JsonToAvroConverter()
+        converter.json_type_to_avro_type(json_type, "Thing", "", "com.test.example", [], json_type, "", [], [])
+        self.assertEqual(original, json_type)
+
+    def test_type_imported_twice_from_different_namespaces(self):
+        """Test that a $ref imported from two nested records is emitted once and referenced by name afterwards."""
+        from avrotize.jsonstoavro import JsonToAvroConverter
+        address = {"type": "object", "properties": {"street": {"type": "string"}, "city": {"type": "string"}}}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with open(os.path.join(temp_dir, "external.json"), 'w', encoding='utf-8') as f:
+                json.dump({"definitions": {"Address": address}}, f)
+            root_path = os.path.join(temp_dir, "root.json")
+            with open(root_path, 'w', encoding='utf-8') as f:
+                json.dump({"type": "object", "properties": {
+                    "home": {"type": "object", "properties": {"address": {"$ref": "external.json#/definitions/Address"}}},
+                    "work": {"type": "object", "properties": {
+                        "inner": {"type": "object", "properties": {"address": {"$ref": "external.json#/definitions/Address"}}}}}
+                }}, f)
+            converter = JsonToAvroConverter()
+            avro_schema = converter.convert_jsons_to_avro(root_path, os.path.join(temp_dir, "root.avsc"), "com.test.example")
+            with open(os.path.join(temp_dir, "root.avsc"), 'r', encoding='utf-8') as f:
+                written_schema = json.load(f)
+        self.assertEqual(avro_schema, written_schema)
+        self.assertTrue(all(isinstance(t, str) for t in converter.imported_types.values()))
+        home, work = (field["type"][1] for field in avro_schema["fields"])
+        self.assertEqual("com.test.example.document_types", home["namespace"])
+        self.assertEqual("com.test.example.document_types.work_types", work["fields"][0]["type"][1]["namespace"])
+        inline_address = home["fields"][0]["type"][1]
+        self.assertEqual("Address", inline_address["name"])
+        self.assertEqual(["street", "city"], [field["name"] for field in inline_address["fields"]])
+        referenced_address = work["fields"][0]["type"][1]["fields"][0]["type"][1]
+        self.assertEqual(inline_address["namespace"] + ".Address", referenced_address)